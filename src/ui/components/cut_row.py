@@ -0,0 +1,202 @@
+"""
+Cut Row Widget
+Pooled row for the virtualized cuts list, drawn as items on the list canvas
+"""
+
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Optional
+from ..styles.theme import COLORS, SPACING
+
+# Every row has the same height so the visible range can be computed
+# from the scroll offset alone
+ROW_HEIGHT = 100  # 60px thumbnail + padding + gap between rows
+
+# Row geometry (relative to the row's top-left corner)
+_ROW_BOX_HEIGHT = ROW_HEIGHT - SPACING["sm"]
+_THUMB_WIDTH, _THUMB_HEIGHT = 80, 60
+_THUMB_X = SPACING["md"]
+_THUMB_Y = (_ROW_BOX_HEIGHT - _THUMB_HEIGHT) // 2
+_TITLE_X = _THUMB_X + _THUMB_WIDTH + SPACING["md"]
+_BADGE_WIDTH, _BADGE_HEIGHT = 50, 18
+_ROW_RADIUS = 8
+_THUMB_RADIUS = 6
+
+# Row fonts
+_FONT_THUMB = ("Segoe UI", 28)  # Fallback type icon in the thumbnail area
+_FONT_BADGE = ("Segoe UI", 9, "bold")
+
+# Row background options for the unselected/selected states
+_ROW_STYLE = {
+    "outline": COLORS["border"],
+    "width": 2,
+    "fill": COLORS["primary"],
+}
+_SELECTED_ROW_STYLE = {
+    "outline": COLORS["accent"],
+    "width": 3,
+    "fill": COLORS["hover"],
+}
+
+
+def _rounded_rect_points(x1, y1, x2, y2, radius):
+    """Polygon points that draw a rounded rectangle when used with smooth=True"""
+    return (
+        x1 + radius, y1, x2 - radius, y1, x2, y1, x2, y1 + radius,
+        x2, y2 - radius, x2, y2, x2 - radius, y2, x1 + radius, y2,
+        x1, y2, x1, y2 - radius, x1, y1 + radius, x1, y1,
+    )
+
+
+@dataclass
+class CutRowData:
+    """Precomputed display values for one cut"""
+    __slots__ = ("icon", "title", "badge")  # Declared by hand to stay compatible with Python 3.8
+
+    icon: str
+    title: str
+    badge: Optional[str]
+
+
+class CutRowWidget:
+    """
+    One pooled row of the virtualized cuts list
+    The row is a group of canvas items (no Tk widgets); they are created once
+    and rebind() only reconfigures and moves them for another cut
+    """
+
+    def __init__(self, canvas: tk.Canvas, title_style, width: int):
+        """
+        Create the row items, parked outside the scroll region
+
+        Args:
+            canvas: List canvas the row is drawn on
+            title_style: Text style mapping (text_color, font) for the title
+            width: Initial row width in pixels
+        """
+        self.canvas = canvas
+        self.cut_index = None
+        self.is_selected = False
+        self.width = width
+        self.tag = f"cutrow{id(self)}"  # Moves every item of the row at once
+        self._y = -ROW_HEIGHT * 2
+
+        x, y = SPACING["xs"], self._y
+        tags = (self.tag,)
+
+        # Background with border, doubles as the selection indicator
+        self.bg_id = canvas.create_polygon(
+            _rounded_rect_points(x, y, x + width, y + _ROW_BOX_HEIGHT, _ROW_RADIUS),
+            smooth=True,
+            tags=tags,
+            **_ROW_STYLE
+        )
+
+        # Thumbnail area: real video frame, or type icon as fallback
+        thumb_x, thumb_y = x + _THUMB_X, y + _THUMB_Y
+        canvas.create_polygon(
+            _rounded_rect_points(thumb_x, thumb_y, thumb_x + _THUMB_WIDTH, thumb_y + _THUMB_HEIGHT, _THUMB_RADIUS),
+            smooth=True,
+            fill=COLORS["input_bg"],
+            outline="",
+            tags=tags
+        )
+        thumb_center = (thumb_x + _THUMB_WIDTH // 2, thumb_y + _THUMB_HEIGHT // 2)
+        self.image_id = canvas.create_image(*thumb_center, tags=tags)
+        self.icon_id = canvas.create_text(
+            *thumb_center,
+            text="",
+            font=_FONT_THUMB,
+            fill=COLORS["text_secondary"],
+            tags=tags
+        )
+
+        # Title with type icon as prefix (wraps instead of running under the badge)
+        self.title_id = canvas.create_text(
+            x + _TITLE_X, y + _ROW_BOX_HEIGHT // 2,
+            text="",
+            anchor="w",
+            fill=title_style["text_color"],
+            font=title_style["font"],
+            tags=tags
+        )
+
+        # Type badge (only shown for some types)
+        self.badge_bg_id = canvas.create_rectangle(0, 0, 0, 0, fill=COLORS["accent"], outline="", state="hidden", tags=tags)
+        self.badge_text_id = canvas.create_text(
+            0, 0,
+            text="",
+            fill="white",
+            font=_FONT_BADGE,
+            state="hidden",
+            tags=tags
+        )
+
+        self.set_width(width)
+
+    def set_width(self, width: int):
+        """Lay out the width-dependent items for the list width"""
+        self.width = width
+        x, y = SPACING["xs"], self._y
+        right = x + width
+        center_y = y + _ROW_BOX_HEIGHT // 2
+
+        self.canvas.coords(self.bg_id, *_rounded_rect_points(x, y, right, y + _ROW_BOX_HEIGHT, _ROW_RADIUS))
+        badge_right = right - SPACING["md"]
+        badge_left = badge_right - _BADGE_WIDTH
+        self.canvas.coords(
+            self.badge_bg_id,
+            badge_left, center_y - _BADGE_HEIGHT // 2, badge_right, center_y + _BADGE_HEIGHT // 2
+        )
+        self.canvas.coords(self.badge_text_id, badge_left + _BADGE_WIDTH // 2, center_y)
+        self.canvas.itemconfigure(self.title_id, width=max(1, badge_left - SPACING["sm"] - (x + _TITLE_X)))
+
+    def rebind(self, index: int, row_data: CutRowData, photo_image, selected: bool):
+        """
+        Show another cut in this row (item configure/move only, nothing created)
+
+        Args:
+            index: Cut index in the list
+            row_data: Precomputed display values for the cut
+            photo_image: Thumbnail PhotoImage, or None to show the type icon
+            selected: Whether the cut is the selected one
+        """
+        if index != self.cut_index:
+            self._move_to(index * ROW_HEIGHT + SPACING["xs"])
+            self.cut_index = index
+
+        # Real video thumbnail, or type icon as fallback
+        if photo_image is not None:
+            self.canvas.itemconfigure(self.image_id, image=photo_image)
+            self.canvas.itemconfigure(self.icon_id, text="")
+        else:
+            self.canvas.itemconfigure(self.image_id, image="")
+            self.canvas.itemconfigure(self.icon_id, text=row_data.icon)
+
+        # Title with icon prefix
+        self.canvas.itemconfigure(self.title_id, text=row_data.title)
+
+        # Type badge (only for some types)
+        badge_state = "normal" if row_data.badge else "hidden"
+        self.canvas.itemconfigure(self.badge_text_id, text=row_data.badge or "", state=badge_state)
+        self.canvas.itemconfigure(self.badge_bg_id, state=badge_state)
+
+        self.set_selected(selected)
+
+    def park(self):
+        """Unbind the row and move it outside the scroll region"""
+        if self.cut_index is not None:
+            self.cut_index = None
+            self._move_to(-ROW_HEIGHT * 2)
+
+    def _move_to(self, y: int):
+        """Move all row items so the row's top edge is at canvas y"""
+        self.canvas.move(self.tag, 0, y - self._y)
+        self._y = y
+
+    def set_selected(self, selected: bool):
+        """Apply selected/unselected styling if it changed"""
+        if self.is_selected == selected:
+            return
+        self.is_selected = selected
+        self.canvas.itemconfigure(self.bg_id, **(_SELECTED_ROW_STYLE if selected else _ROW_STYLE))
@@ -5,8 +5,81 @@ Main Editor - Left Panel with Cuts List
 
 import customtkinter as ctk
 import tkinter as tk
-from PIL import Image, ImageTk
-from ..styles.theme import get_frame_style, get_text_style, get_button_style, COLORS, SPACING
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from ..styles.theme import get_frame_style, get_text_style, COLORS, SPACING
+from .cut_row import ROW_HEIGHT, CutRowData, CutRowWidget
+
+__all__ = ["CutsListComponent"]
+
+ROW_OVERSCAN = 2  # Extra pooled rows kept above/below the viewport
+THUMBNAIL_PREFETCH_BATCH = 25  # Thumbnails queued per idle callback
+THUMBNAIL_SIZE = (80, 60)
+THUMBNAIL_WORKERS = 2  # Background threads resizing frames for the list
+THUMBNAIL_POLL_MS = 30  # Finished resizes are picked up this often while any are pending
+
+# Per-type row style: (icon, badge text or None when the type has no badge)
+_TYPE_STYLE = {
+    "major_theme": ("📚", "THEME"),
+    "thematic_segment": ("📖", None),
+    "standard_clip": ("🎬", None),
+    "quick_insight": ("⚡", None),
+    "highlight_clip": ("🎥", "CLIP"),
+}
+_DEFAULT_TYPE_STYLE = ("🎥", None)
+
+# content_type from JSON data -> internal type
+_CONTENT_TYPE_MAP = {
+    "topic_segment": "thematic_segment",
+    "concept_explanation": "standard_clip",
+    "key_moment": "quick_insight",
+    "major_discussion": "major_theme",  # Map major discussions as themes
+    "major_theme": "major_theme",
+    "thematic_segment": "thematic_segment",
+    "standard_clip": "standard_clip",
+    "quick_insight": "quick_insight",
+    "highlight_clip": "standard_clip"
+}
+
+# Read-only mock cuts for testing; copy with dict(cut) before mutating
+MOCK_CUTS = (
+    MappingProxyType({
+        "id": 1,
+        "title": "Introduction",
+        "description": "Welcome message and overview",
+        "start_time": "00:00:30",
+        "end_time": "00:02:15",
+        "duration": "00:01:45",
+        "status": "ready"
+    }),
+    MappingProxyType({
+        "id": 2,
+        "title": "Main Topic",
+        "description": "Core content explanation",
+        "start_time": "00:02:15",
+        "end_time": "00:05:30",
+        "duration": "00:03:15",
+        "status": "ready"
+    }),
+    MappingProxyType({
+        "id": 3,
+        "title": "Examples",
+        "description": "Practical demonstrations",
+        "start_time": "00:05:30",
+        "end_time": "00:08:45",
+        "duration": "00:03:15",
+        "status": "ready"
+    }),
+    MappingProxyType({
+        "id": 4,
+        "title": "Conclusion",
+        "description": "Summary and closing remarks",
+        "start_time": "00:08:45",
+        "end_time": "00:10:00",
+        "duration": "00:01:15",
+        "status": "processing"
+    }),
+)
 
 class CutsListComponent(ctk.CTkFrame):
     def __init__(self, parent, on_cut_selected=None, video_info=None, thumbnail_cache=None, **kwargs):
@@ -24,7 +97,29 @@ class CutsListComponent(ctk.CTkFrame):
         # Cuts data and selection
         self.cuts_data = []
         self.selected_cut_id = None
-        self.cut_widgets = []
+        self._prev_selected = None
+        
+        # Virtualized rendering state: a small pool of row widgets is rebound
+        # to whichever cuts are currently inside the viewport
+        self._row_pool = []
+        self._first_visible = -1
+        self._row_cache = []  # Precomputed display strings, parallel to cuts_data
+        # Counter columns, parallel to cuts_data (raw "type" and "social_media_value")
+        self._cut_types = []
+        self._social_values = []
+        self._prefetch_job = None
+        self._select_job = None
+        
+        # Thumbnails are resized into the disk cache on worker threads; a timer on
+        # the Tk main thread picks up finished resizes and installs the PhotoImage
+        # (workers never call into Tk)
+        self._thumb_pool = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="cuts-thumbs")
+        self._thumb_futures = {}  # cut index -> pending resize future
+        self._thumb_failed = set()  # Indices without a frame this load; not requested again
+        self._thumb_poll_job = None
+        
+        # Text styles shared by every pooled row
+        self._title_style = get_text_style("default")
         
         # Setup UI
         self.setup_ui()
@@ -79,212 +174,278 @@ class CutsListComponent(ctk.CTkFrame):
         self.counter_label.grid(row=counter_row, column=0, pady=(SPACING["xs"], SPACING["sm"]))
     
     def create_cuts_list(self):
-        """Create scrollable cuts list"""
-        # Scrollable frame
-        self.scrollable_frame = ctk.CTkScrollableFrame(
+        """Create virtualized cuts list (canvas + scrollbar with pooled rows)"""
+        list_frame = ctk.CTkFrame(
             self,
             fg_color=COLORS["secondary"],
             corner_radius=8
         )
-        self.scrollable_frame.grid(row=1, column=0, sticky="nsew", padx=SPACING["md"], pady=(0, SPACING["md"]))
-        self.scrollable_frame.grid_columnconfigure(0, weight=1)
+        list_frame.grid(row=1, column=0, sticky="nsew", padx=SPACING["md"], pady=(0, SPACING["md"]))
+        list_frame.grid_columnconfigure(0, weight=1)
+        list_frame.grid_rowconfigure(0, weight=1)
+        
+        # Plain Tk canvas: rows are groups of canvas items positioned at index * ROW_HEIGHT
+        self.list_canvas = tk.Canvas(
+            list_frame,
+            bg=COLORS["secondary"],
+            bd=0,
+            highlightthickness=0,
+            yscrollincrement=ROW_HEIGHT // 4
+        )
+        self.list_canvas.grid(row=0, column=0, sticky="nsew", padx=(SPACING["xs"], 0), pady=SPACING["xs"])
+        
+        self.scrollbar = ctk.CTkScrollbar(list_frame, command=self._on_yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns", padx=(0, SPACING["xs"]), pady=SPACING["xs"])
+        self.list_canvas.configure(yscrollcommand=self.scrollbar.set)
+        
+        self.list_canvas.bind("<Configure>", self._on_canvas_configure)
+        
+        # Rows are canvas items, so every click and wheel event lands on the canvas
+        self.list_canvas.bind("<Button-1>", self._on_row_click)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.list_canvas.bind(sequence, self._on_mousewheel)
+    
+    def _on_row_click(self, event):
+        """Hit-test the click against the fixed row height and select that cut"""
+        canvas_y = self.list_canvas.canvasy(event.y)
+        self.select_cut(int(canvas_y // ROW_HEIGHT))
+    
+    def _on_mousewheel(self, event):
+        """Scroll the list by a few units per wheel notch"""
+        step = -3 if (event.num == 4 or event.delta > 0) else 3
+        self.list_canvas.yview_scroll(step, "units")
+        self._refresh_rows()
+    
+    def _on_yview(self, *args):
+        """Scrollbar command: move the canvas view and rebind rows"""
+        self.list_canvas.yview(*args)
+        self._refresh_rows()
+    
+    def _on_canvas_configure(self, event):
+        """Resize pooled rows to the canvas width and grow the pool to fill the viewport"""
+        row_width = max(1, event.width - SPACING["sm"])
+        for row in self._row_pool:
+            row.set_width(row_width)
+        
+        self._ensure_pool(event.height // ROW_HEIGHT + 1 + ROW_OVERSCAN)
+        self._update_scrollregion()
+        self._refresh_rows(force=True)
+    
+    def _update_scrollregion(self):
+        """Size the scrollable area to the full list, independent of the pooled rows"""
+        self.list_canvas.configure(
+            scrollregion=(0, 0, self.list_canvas.winfo_width(), ROW_HEIGHT * len(self.cuts_data))
+        )
+    
+    def _ensure_pool(self, count):
+        """Create pooled rows until the pool holds at least ``count`` rows"""
+        row_width = max(1, self.list_canvas.winfo_width() - SPACING["sm"])
+        while len(self._row_pool) < count:
+            self._row_pool.append(CutRowWidget(self.list_canvas, self._title_style, row_width))
     
     def load_cuts(self, cuts_data):
-        """Load cuts data and create UI elements"""
+        """Load cuts data and bind it to the pooled rows"""
         self.cuts_data = cuts_data
         self.clear_cuts_list()
+        self._build_row_cache()
+        
+        self._ensure_pool(self.list_canvas.winfo_height() // ROW_HEIGHT + 1 + ROW_OVERSCAN)
+        self._update_scrollregion()
+        self.list_canvas.yview_moveto(0)
+        self._refresh_rows(force=True)
         
-        for i, cut in enumerate(cuts_data):
-            self.create_cut_item(cut, i)
+        # Queue the remaining thumbnails for the workers so scrolling is cheap
+        self._prefetch_job = self.after_idle(self._prefetch_thumbnails, 0)
         
         # Update counter
         self.update_counter()
         
-        # Select first cut by default
+        # Select first cut by default once the list has been drawn, so load_cuts
+        # returns before the selection callback loads the preview
         if cuts_data:
+            self._select_job = self.after_idle(self._select_first_cut)
+    
+    def _select_first_cut(self):
+        """Idle callback: select the first cut unless the user already picked one"""
+        self._select_job = None
+        if self.selected_cut_id is None:
             self.select_cut(0)
     
     def clear_cuts_list(self):
-        """Clear all cut items from the list"""
-        for widget in self.cut_widgets:
-            widget.destroy()
-        self.cut_widgets.clear()
+        """Reset list state; pooled row widgets and converted thumbnails are kept for reuse"""
+        self.selected_cut_id = None
+        self._prev_selected = None
+        self._first_visible = -1
+        if self._prefetch_job is not None:
+            self.after_cancel(self._prefetch_job)
+            self._prefetch_job = None
+        if self._select_job is not None:
+            self.after_cancel(self._select_job)
+            self._select_job = None
+        
+        # Drop pending thumbnail work so results never touch the new list
+        self._cancel_thumbnail_requests()
+        self._thumb_failed.clear()
     
-    def create_cut_item(self, cut_data, index, thumbnail_override=None):
-        """Create a single cut item with enhanced information display"""
-        # Main cut frame
-        cut_frame = ctk.CTkFrame(
-            self.scrollable_frame,
-            fg_color=COLORS["primary"],
-            corner_radius=8,
-            border_width=2,
-            border_color=COLORS["border"]
-        )
-        cut_frame.grid(row=index, column=0, sticky="ew", padx=SPACING["sm"], pady=SPACING["sm"])
-        cut_frame.grid_columnconfigure(1, weight=1)
-
-        # Store reference and add click binding
-        self.cut_widgets.append(cut_frame)
-        cut_frame.bind("<Button-1>", lambda e, idx=index: self.select_cut(idx))
-
-        # Thumbnail with real video frame
-        thumbnail = ctk.CTkFrame(
-            cut_frame,
-            width=80,
-            height=60,
-            fg_color=COLORS["input_bg"],
-            corner_radius=6
-        )
-        thumbnail.grid(row=0, column=0, rowspan=3, padx=SPACING["md"], pady=SPACING["md"], sticky="ns")
-        thumbnail.grid_propagate(False)
-
-        # Try to get real video thumbnail
-        thumbnail_image = thumbnail_override  # Use provided thumbnail if available
-        if thumbnail_image is None and self.thumbnail_cache:
-            start_time = cut_data.get("start_time", cut_data.get("start", "00:00:00"))
-            thumbnail_image = self.thumbnail_cache.get_thumbnail(start_time)
-
-        if thumbnail_image:
-            try:
-                # Resize original frame to thumbnail size (80x60)
-                thumbnail_resized = thumbnail_image.resize((80, 60), Image.Resampling.LANCZOS)
-                photo_image = ImageTk.PhotoImage(thumbnail_resized)
-                thumb_label = tk.Label(
-                    thumbnail,
-                    image=photo_image,
-                    bg=COLORS["input_bg"],
-                    bd=0,
-                    highlightthickness=0
-                )
-                # Store reference to prevent garbage collection
-                if not hasattr(self, '_photo_images'):
-                    self._photo_images = []
-                self._photo_images.append(photo_image)
-                thumb_label.place(relx=0.5, rely=0.5, anchor="center")
-                thumb_label.bind("<Button-1>", lambda e, idx=index: self.select_cut(idx))
-            except Exception as e:
-                print(f"⚠️ Error displaying thumbnail: {e}")
-                self._create_fallback_thumbnail_icon(thumbnail, cut_data, index)
-        else:
-            self._create_fallback_thumbnail_icon(thumbnail, cut_data, index)
-
-        # Cut information
-        info_frame = ctk.CTkFrame(cut_frame, fg_color="transparent")
-        info_frame.grid(row=0, column=1, columnspan=2, sticky="ew", padx=(0, SPACING["md"]), pady=SPACING["sm"])
-        info_frame.grid_columnconfigure(0, weight=1)
-
-        # Title with type icon as prefix
-        title_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-        title_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(SPACING["sm"], SPACING["xs"]))
-        title_frame.grid_columnconfigure(0, weight=1)
-
-        title_style = get_text_style("default")
-        # Get icon for type
-        content_type = cut_data.get("content_type", "unknown")
-        cut_type = cut_data.get("type", self._map_content_type_to_type(content_type))
-        if cut_type == "major_theme":
-            thumb_icon_text = "📚"
-        elif cut_type == "thematic_segment":
-            thumb_icon_text = "📖"
-        elif cut_type == "standard_clip":
-            thumb_icon_text = "🎬"
-        elif cut_type == "quick_insight":
-            thumb_icon_text = "⚡"
-        else:
-            thumb_icon_text = "🎥"
-        # Title with icon prefix
-        title_with_icon = f"{thumb_icon_text} {cut_data.get('title', f'Cut {index + 1}') }"
-        title_label = ctk.CTkLabel(
-            title_frame,
-            text=title_with_icon,
-            **title_style
-        )
-        title_label.grid(row=0, column=0, sticky="w")
-        title_label.bind("<Button-1>", lambda e, idx=index: self.select_cut(idx))
-
-        # Type badge (opcional, solo para algunos tipos)
-        if cut_type in ["major_theme", "highlight_clip"]:
-            badge_text = "THEME" if cut_type == "major_theme" else "CLIP"
-            badge_color = COLORS["accent"] if cut_type == "major_theme" else COLORS["accent"]
-            type_badge = ctk.CTkLabel(
-                title_frame,
-                text=badge_text,
-                font=("Segoe UI", 9, "bold"),
-                text_color="white",
-                fg_color=badge_color,
-                corner_radius=3,
-                width=50,
-                height=18
-            )
-            type_badge.grid(row=0, column=1, sticky="e", padx=(SPACING["sm"], 0))
-            type_badge.bind("<Button-1>", lambda e, idx=index: self.select_cut(idx))
-            
-        return cut_frame
-
-    def _create_fallback_thumbnail_icon(self, parent, cut_data, index):
-        """Fallback: show icon in thumbnail area if no real frame available"""
-        content_type = cut_data.get("content_type", "unknown")
-        cut_type = cut_data.get("type", self._map_content_type_to_type(content_type))
-        if cut_type == "major_theme":
-            thumb_icon_text = "📚"
-        elif cut_type == "thematic_segment":
-            thumb_icon_text = "📖"
-        elif cut_type == "standard_clip":
-            thumb_icon_text = "🎬"
-        elif cut_type == "quick_insight":
-            thumb_icon_text = "⚡"
-        else:
-            thumb_icon_text = "🎥"
-        icon_label = ctk.CTkLabel(
-            parent,
-            text=thumb_icon_text,
-            font=("Segoe UI", 28),
-            text_color=COLORS["text_secondary"]
+    def _build_row_cache(self):
+        """Precompute row display values and counter columns for every cut once per load"""
+        self._row_cache = []
+        self._cut_types = []
+        self._social_values = []
+        for index, cut_data in enumerate(self.cuts_data):
+            cut_type = cut_data.get("type")
+            self._cut_types.append(cut_type)
+            self._social_values.append(cut_data.get("social_media_value"))
+            if cut_type is None:
+                cut_type = self._map_content_type_to_type(cut_data.get("content_type", "unknown"))
+            thumb_icon_text, badge_text = _TYPE_STYLE.get(cut_type, _DEFAULT_TYPE_STYLE)
+            self._row_cache.append(CutRowData(
+                icon=thumb_icon_text,
+                title=f"{thumb_icon_text} {cut_data.get('title', f'Cut {index + 1}')}",
+                badge=badge_text,
+            ))
+    
+    def _refresh_rows(self, force=False):
+        """Rebind pooled rows to the cuts currently inside the viewport"""
+        first = max(0, int(self.list_canvas.canvasy(0) // ROW_HEIGHT) - ROW_OVERSCAN // 2)
+        if first == self._first_visible and not force:
+            return
+        self._first_visible = first
+        
+        # Cut i always lives in slot i % pool_size, so scrolling by one row only
+        # rebinds the single row that left the window; the rest keep their cut
+        pool_size = len(self._row_pool)
+        for index in range(first, first + pool_size):
+            row = self._row_pool[index % pool_size]
+            if index >= len(self.cuts_data):
+                row.park()
+            elif force or row.cut_index != index:
+                self._bind_row(row, index)
+    
+    def _bind_row(self, row, index):
+        """Show cut ``index`` in a pooled row"""
+        row.rebind(index, self._row_cache[index], self._get_photo_image(index), index == self.selected_cut_id)
+    
+    def _get_photo_image(self, index):
+        """
+        Get the thumbnail PhotoImage for a cut if it is ready, otherwise queue it
+        Rows show the type icon until the worker result is installed.
+        """
+        if not self.thumbnail_cache:
+            return None
+        
+        photo_image = self.thumbnail_cache.peek_photoimage(self._get_start_time(index), THUMBNAIL_SIZE)
+        if photo_image is None:
+            self._request_thumbnail(index)
+        return photo_image
+    
+    def _get_start_time(self, index):
+        """Start time string of a cut, as used for thumbnail cache keys"""
+        cut_data = self.cuts_data[index]
+        return cut_data.get("start_time", cut_data.get("start", "00:00:00"))
+    
+    def _request_thumbnail(self, index):
+        """Resize a cut's frame on a worker thread unless it is already queued (or failed)"""
+        if index in self._thumb_futures or index in self._thumb_failed:
+            return
+        
+        self._thumb_futures[index] = self._thumb_pool.submit(
+            self.thumbnail_cache.prepare_thumbnail_file, self._get_start_time(index), THUMBNAIL_SIZE
         )
-        icon_label.place(relx=0.5, rely=0.5, anchor="center")
-        icon_label.bind("<Button-1>", lambda e, idx=index: self.select_cut(idx))
+        if self._thumb_poll_job is None:
+            self._thumb_poll_job = self.after(THUMBNAIL_POLL_MS, self._poll_thumbnails)
+    
+    def _poll_thumbnails(self):
+        """Timer on the Tk thread: install finished resizes, keep polling while any are pending"""
+        self._thumb_poll_job = None
+        finished = [(index, future) for index, future in self._thumb_futures.items() if future.done()]
+        for index, future in finished:
+            del self._thumb_futures[index]
+            self._install_thumbnail(index, future)
+        
+        if self._thumb_futures:
+            self._thumb_poll_job = self.after(THUMBNAIL_POLL_MS, self._poll_thumbnails)
+    
+    def _cancel_thumbnail_requests(self):
+        """Cancel queued resizes and stop polling for them"""
+        for future in self._thumb_futures.values():
+            future.cancel()
+        self._thumb_futures.clear()
+        if self._thumb_poll_job is not None:
+            self.after_cancel(self._thumb_poll_job)
+            self._thumb_poll_job = None
+    
+    def _install_thumbnail(self, index, future):
+        """Load the PhotoImage for a finished resize and show it if its row is visible"""
+        # A missing frame or failed write is remembered, so rebinding the row while
+        # scrolling does not queue the same resize again
+        if future.cancelled() or future.exception() is not None or future.result() is None:
+            self._thumb_failed.add(index)
+            return
+        
+        photo_image = self.thumbnail_cache.get_photoimage(self._get_start_time(index), THUMBNAIL_SIZE)
+        if photo_image is None:
+            return
+        row = self._row_for_index(index)
+        if row is not None:
+            self._bind_row(row, index)
+    
+    def _prefetch_thumbnails(self, start):
+        """Queue thumbnail resizes in small batches while the event loop is idle"""
+        self._prefetch_job = None
+        if not self.thumbnail_cache:
+            return
+        
+        end = min(start + THUMBNAIL_PREFETCH_BATCH, len(self.cuts_data))
+        for index in range(start, end):
+            if self.thumbnail_cache.peek_photoimage(self._get_start_time(index), THUMBNAIL_SIZE) is None:
+                self._request_thumbnail(index)
+        
+        if end < len(self.cuts_data):
+            self._prefetch_job = self.after_idle(self._prefetch_thumbnails, end)
     
     def select_cut(self, index):
         """Select a cut and update visual feedback"""
-        if 0 <= index < len(self.cuts_data):
-            # Update selection
-            self.selected_cut_id = index
-            
-            # Update visual feedback
-            self.update_selection_visual()
-            
-            # Notify parent
-            if self.on_cut_selected:
-                self.on_cut_selected(self.cuts_data[index], index)
+        if index is None or not 0 <= index < len(self.cuts_data):
+            return
+        
+        # Re-selecting the current cut is a no-op (avoids reloading the preview)
+        if index == self.selected_cut_id:
+            return
+        
+        # Update selection
+        self.selected_cut_id = index
+        
+        # Update visual feedback
+        self.update_selection_visual()
+        
+        # Notify parent
+        if self.on_cut_selected:
+            self.on_cut_selected(self.cuts_data[index], index)
     
     def update_selection_visual(self):
-        """Update visual feedback for selected cut"""
-        for i, widget in enumerate(self.cut_widgets):
-            if i == self.selected_cut_id:
-                # Selected state
-                widget.configure(
-                    border_color=COLORS["accent"],
-                    border_width=3,
-                    fg_color=COLORS["hover"]
-                )
-            else:
-                # Unselected state
-                widget.configure(
-                    border_color=COLORS["border"],
-                    border_width=2,
-                    fg_color=COLORS["primary"]
-                )
+        """Update visual feedback for selected cut (only the rows that changed)"""
+        for index in (self._prev_selected, self.selected_cut_id):
+            row = self._row_for_index(index)
+            if row is not None:
+                row.set_selected(index == self.selected_cut_id)
+        self._prev_selected = self.selected_cut_id
+    
+    def _row_for_index(self, index):
+        """Pooled row currently showing cut ``index``, or None if it is not visible"""
+        if index is None or not self._row_pool:
+            return None
+        row = self._row_pool[index % len(self._row_pool)]
+        return row if row.cut_index == index else None
     
     def update_counter(self):
         """Update the cuts counter with type breakdown"""
         total_count = len(self.cuts_data)
         
-        # Count by type
-        theme_count = len([cut for cut in self.cuts_data if cut.get("type") == "major_theme"])
-        clip_count = len([cut for cut in self.cuts_data if cut.get("type") == "highlight_clip"])
-        
-        # Count by social media value
-        high_value_count = len([cut for cut in self.cuts_data if cut.get("social_media_value") == "high"])
+        # Count by type and social media value over the precomputed columns
+        theme_count = self._cut_types.count("major_theme")
+        clip_count = self._cut_types.count("highlight_clip")
+        high_value_count = self._social_values.count("high")
         
         if total_count == 0:
             counter_text = "No cuts available"
@@ -313,60 +474,12 @@ class CutsListComponent(ctk.CTkFrame):
         Returns:
             Internal type string (e.g., "major_theme", "thematic_segment")
         """
-        content_type_mapping = {
-            "topic_segment": "thematic_segment",
-            "concept_explanation": "standard_clip", 
-            "key_moment": "quick_insight",
-            "major_discussion": "major_theme",  # Map major discussions as themes
-            "major_theme": "major_theme",
-            "thematic_segment": "thematic_segment",
-            "standard_clip": "standard_clip",
-            "quick_insight": "quick_insight",
-            "highlight_clip": "standard_clip"
-        }
-        
-        return content_type_mapping.get(content_type, "standard_clip")
+        return _CONTENT_TYPE_MAP.get(content_type, "standard_clip")
 
-    def get_mock_cuts_data(self):
-        """Generate mock cuts data for testing"""
-        return [
-            {
-                "id": 1,
-                "title": "Introduction",
-                "description": "Welcome message and overview",
-                "start_time": "00:00:30",
-                "end_time": "00:02:15",
-                "duration": "00:01:45",
-                "status": "ready"
-            },
-            {
-                "id": 2,
-                "title": "Main Topic",
-                "description": "Core content explanation",
-                "start_time": "00:02:15",
-                "end_time": "00:05:30",
-                "duration": "00:03:15",
-                "status": "ready"
-            },
-            {
-                "id": 3,
-                "title": "Examples",
-                "description": "Practical demonstrations",
-                "start_time": "00:05:30",
-                "end_time": "00:08:45",
-                "duration": "00:03:15",
-                "status": "ready"
-            },
-            {
-                "id": 4,
-                "title": "Conclusion",
-                "description": "Summary and closing remarks",
-                "start_time": "00:08:45",
-                "end_time": "00:10:00",
-                "duration": "00:01:15",
-                "status": "processing"
-            }
-        ]
+    @staticmethod
+    def get_mock_cuts_data():
+        """Get the shared read-only mock cuts data for testing"""
+        return MOCK_CUTS
     
     def refresh_cut_thumbnail(self, cut_id):
         """Refresh the thumbnail for a specific cut after it has been regenerated"""
@@ -378,23 +491,20 @@ class CutsListComponent(ctk.CTkFrame):
                     cut_index = i
                     break
             
-            if cut_index is not None and cut_index < len(self.cut_widgets):
-                # Force reload the thumbnail from cache and recreate the item
+            if cut_index is not None:
+                # The thumbnail cache drops its PhotoImage when a frame is regenerated
                 if self.thumbnail_cache:
-                    cut_data = self.cuts_data[cut_index]
-                    start_time = cut_data.get('start_time', cut_data.get('start', '00:00:00'))
-                    cached_frame = self.thumbnail_cache.get_thumbnail(start_time)
+                    cached_frame = self.thumbnail_cache.get_thumbnail(self._get_start_time(cut_index))
                     
                     if cached_frame is not None:
-                        # Remove the old widget
-                        old_frame = self.cut_widgets[cut_index]
-                        old_frame.destroy()
-                        
-                        # Create new cut item with updated thumbnail
-                        new_cut_frame = self.create_cut_item(cut_data, cut_index, thumbnail_override=cached_frame)
-                        
-                        # Replace in the list
-                        self.cut_widgets[cut_index] = new_cut_frame
+                        # Rebind the row only if it is currently visible (queues the resize)
+                        stale_future = self._thumb_futures.pop(cut_index, None)
+                        if stale_future is not None:
+                            stale_future.cancel()
+                        self._thumb_failed.discard(cut_index)
+                        row = self._row_for_index(cut_index)
+                        if row is not None:
+                            self._bind_row(row, cut_index)
                         
                         print(f"✅ Refreshed thumbnail for cut {cut_id}")
                     else:
@@ -405,6 +515,12 @@ class CutsListComponent(ctk.CTkFrame):
         except Exception as e:
             print(f"❌ Error refreshing thumbnail for cut {cut_id}: {e}")
     
+    def destroy(self):
+        """Stop the thumbnail workers before destroying the component"""
+        self._cancel_thumbnail_requests()
+        self._thumb_pool.shutdown(wait=False)
+        super().destroy()
+    
     def recreate_cut_item(self, cut_frame, new_thumbnail_image):
         """Recreate a cut item with updated thumbnail"""
         # This method is now obsolete, functionality moved to refresh_cut_thumbnail
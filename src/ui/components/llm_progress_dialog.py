@@ -5,30 +5,59 @@ Shows progress during AI-powered video analysis
 
 import customtkinter as ctk
 import tkinter as tk
-import queue
 import threading
+import time
+from collections import deque
+from functools import lru_cache
 from typing import Callable, Optional, Dict, Any
 from ..styles.theme import get_frame_style, get_text_style, get_button_style, COLORS, SPACING
 
-# Import the processor dynamically to avoid circular imports
+# Import the processor on first use: there is no import cycle, but the module pulls
+# in openai, ffmpeg and Whisper, which the app should not pay for at startup
+@lru_cache(maxsize=1)
 def get_llm_processor():
     from ...core.llm_cuts_processor import LLMCutsProcessor
     return LLMCutsProcessor
 
-# Progress phases for UI
+# Producer-side throttle: an update in the same phase is dropped when it moves the
+# progress by less than this many percent within this many seconds of the last one
+PROGRESS_THROTTLE_DELTA = 0.5
+PROGRESS_THROTTLE_INTERVAL = 0.033
+
+# Smallest progress bar change worth a redraw (fraction of the full bar)
+PROGRESS_BAR_MIN_DELTA = 0.005
+
+# Percentage label texts, indexed by the rounded percentage
+_PERCENT_TEXT = tuple(f"{percent}%" for percent in range(101))
+
+# Verbose tracing of every progress update (off by default: these paths run for
+# each processor callback and each redraw)
+DEBUG = False
+
+# Queued updates wake the main thread with a virtual event; the timer is only a
+# safety net in case an event is lost (e.g. generated before mainloop runs)
+QUEUE_SAFETY_TICK_MS = 250
+
+# Progress phases for UI (every phase LLMCutsProcessor emits, so the title-case
+# fallback only runs for unknown phases)
 PROGRESS_PHASES = {
     "extracting_audio": "Extracting Audio...",
     "generating_transcription": "Generating Transcription...", 
+    "loading_cache": "Loading Cached Transcription...",
     "analyzing_with_ai": "Analyzing with AI...",
     "finalizing": "Finalizing Results...",
-    "complete": "Complete!"
+    "complete": "Complete!",
+    # Legacy processing path reports display strings as phases
+    "Extrayendo audio...": "Extracting Audio...",
+    "Transcribiendo audio...": "Generating Transcription...",
 }
 
 
 class LLMProgressDialog(ctk.CTkToplevel):
     """Progress dialog for LLM processing with real-time updates"""
     
-    def __init__(self, parent, video_path: str, video_info: dict, api_key: Optional[str], completion_callback: Callable):
+    def __init__(self, parent, video_path: str, video_info: dict, api_key: Optional[str], completion_callback: Callable,
+                 auto_close_delay_ms: int = 2000):
         super().__init__(parent)
         
         # Store parameters
@@ -36,15 +65,39 @@ class LLMProgressDialog(ctk.CTkToplevel):
         self.video_info = video_info
         self.api_key = api_key
         self.completion_callback = completion_callback
+        self.auto_close_delay_ms = auto_close_delay_ms  # <= 0 closes as soon as analysis completes
         
         # Processing state
         self.processor: Optional[Any] = None
         self.is_cancelled = False
         self.is_completed = False
-        
-        # Thread-safe communication
-        self.update_queue = queue.Queue()
-        self.completion_queue = queue.Queue()
+        self.result: Optional[Dict] = None
+        
+        # Bumped for every processing run; a cancelled run's worker thread keeps
+        # running, so its late callbacks carry an old id and are dropped
+        self._run_id = 0
+        
+        # Pending after() jobs, cancelled when the dialog is hidden for reuse
+        self._queue_job = None
+        self._close_job = None  # Delayed auto-close/hide
+        
+        # Thread-safe communication: deque append/popleft are atomic, which is all a
+        # single producer and the polling main thread need. Bounded, since only the
+        # latest updates are drawn anyway
+        self.update_queue = deque(maxlen=256)
+        self.completion_queue = deque(maxlen=4)
+        
+        # Last update accepted into update_queue (written by the processor thread only)
+        self._last_enqueue_t = 0.0
+        self._last_enqueued_phase = None
+        self._last_enqueued_progress = -1.0
+        
+        # Last values written to the progress widgets; unchanged values are not reconfigured
+        self._widgets_ready = False
+        self._last_phase_text = None
+        self._last_progress_text = None
+        self._last_status_text = None
+        self._last_progress_fraction = 0.0
         
         # Setup dialog
         self.setup_dialog()
@@ -55,15 +108,8 @@ class LLMProgressDialog(ctk.CTkToplevel):
     def setup_dialog(self):
         """Configure dialog window"""
         self.title("AI Video Analysis")
-        self.geometry("600x450")  # Increased height to show error messages properly
+        self.center_on_parent()  # 600x450 so error messages show properly
         self.resizable(True, True)  # Allow resizing to see long error messages
-        
-        # Center on parent
-        if hasattr(self.master, 'winfo_x'):
-            parent_x = self.master.winfo_x() + (self.master.winfo_width() // 2) - 300
-            parent_y = self.master.winfo_y() + (self.master.winfo_height() // 2) - 225
-            self.geometry(f"600x450+{parent_x}+{parent_y}")
-        
         self.grab_set()
         
         # Configure grid
@@ -73,6 +119,15 @@ class LLMProgressDialog(ctk.CTkToplevel):
         # Handle close button
         self.protocol("WM_DELETE_WINDOW", self.on_cancel)
     
+    def center_on_parent(self):
+        """Size the dialog and center it on its parent window with a single geometry call"""
+        if hasattr(self.master, 'winfo_x'):
+            parent_x = self.master.winfo_x() + (self.master.winfo_width() // 2) - 300
+            parent_y = self.master.winfo_y() + (self.master.winfo_height() // 2) - 225
+            self.geometry(f"600x450+{parent_x}+{parent_y}")
+        else:
+            self.geometry("600x450")
+    
     def create_ui(self):
         """Create the progress interface"""
         # Main frame
@@ -91,19 +146,17 @@ class LLMProgressDialog(ctk.CTkToplevel):
         title_label.grid(row=0, column=0, pady=(SPACING["lg"], SPACING["md"]))
         
         # Video info
-        video_name = self.video_info.get("filename", "Unknown video")
-        video_duration = self.video_info.get("duration", "Unknown")
-        
         info_style = get_text_style("secondary")
-        info_label = ctk.CTkLabel(
+        self.info_label = ctk.CTkLabel(
             main_frame,
-            text=f"Processing: {video_name}\\nDuration: {video_duration}",
+            text=self._get_video_info_text(),
             **info_style
         )
-        info_label.grid(row=1, column=0, pady=(0, SPACING["lg"]))
+        self.info_label.grid(row=1, column=0, pady=(0, SPACING["lg"]))
         
         # Current phase label
         phase_style = get_text_style("default")
+        self._phase_text_color = phase_style["text_color"]
         self.phase_label = ctk.CTkLabel(
             main_frame,
             text="Initializing...",
@@ -165,75 +218,139 @@ class LLMProgressDialog(ctk.CTkToplevel):
             **close_style
         )
         # Don't grid it yet - will show when complete
+        
+        # Worker threads post these after queueing, so updates are drawn right away
+        self.bind("<<ProgressUpdate>>", self._on_queue_event)
+        self.bind("<<ProgressComplete>>", self._on_queue_event)
+        
+        self._widgets_ready = True
+    
+    def _get_video_info_text(self) -> str:
+        """Text for the video info label"""
+        video_name = self.video_info.get("filename", "Unknown video")
+        video_duration = self.video_info.get("duration", "Unknown")
+        return f"Processing: {video_name}\\nDuration: {video_duration}"
+    
+    def reset(self, video_path: str, video_info: dict, api_key: Optional[str], completion_callback: Callable,
+              auto_close_delay_ms: int = 2000):
+        """
+        Reuse the dialog for another analysis instead of building a new one
+        
+        Args:
+            video_path: Path to video file
+            video_info: Video metadata
+            api_key: OpenAI API key
+            completion_callback: Function to call when complete (success: bool, result: dict)
+            auto_close_delay_ms: Delay before closing after success (<= 0 closes immediately)
+        """
+        self.video_path = video_path
+        self.video_info = video_info
+        self.api_key = api_key
+        self.completion_callback = completion_callback
+        self.auto_close_delay_ms = auto_close_delay_ms
+        self._cancel_jobs()
+        
+        # Processing state
+        self.processor = None
+        self.is_cancelled = False
+        self.is_completed = False
+        self.result = None
+        
+        # Drop anything left over from the previous run
+        self._drain(self.update_queue)
+        self._drain(self.completion_queue)
+        self._last_enqueue_t = 0.0
+        self._last_enqueued_phase = None
+        self._last_enqueued_progress = -1.0
+        self._last_phase_text = None
+        self._last_progress_text = None
+        self._last_status_text = None
+        self._last_progress_fraction = 0.0
+        
+        # Restore the initial widget state
+        self.info_label.configure(text=self._get_video_info_text())
+        self.phase_label.configure(text="Initializing...", text_color=self._phase_text_color)
+        self.progress_bar.configure(progress_color=COLORS["accent"])
+        self.progress_bar.set(0)
+        self.progress_label.configure(text="0%")
+        self.status_label.configure(text="Starting AI analysis...", text_color=COLORS["text_secondary"])
+        self.close_btn.grid_remove()
+        self.cancel_btn.configure(state="normal")
+        self.cancel_btn.grid(row=0, column=0, padx=SPACING["sm"])
+        
+        self.center_on_parent()
+        self.deiconify()
+        self.grab_set()
+        
+        self.start_queue_processing()
+        self.start_processing()
+    
+    def hide(self):
+        """Hide the dialog so it can be reused by the next analysis"""
+        self._cancel_jobs()
+        self.grab_release()
+        self.withdraw()
+    
+    def _cancel_jobs(self):
+        """Cancel the queue polling and any delayed close of the current run"""
+        for job in (self._queue_job, self._close_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._queue_job = None
+        self._close_job = None
     
     def start_processing(self):
         """Start the LLM processing"""
+        self._run_id += 1
+        run_id = self._run_id
         try:
             print(f"🔄 Dialog starting LLM processing...")
             
-            # Test UI updates first
-            self.test_ui_updates()
-            
             # Create processor
             LLMCutsProcessor = get_llm_processor()
             self.processor = LLMCutsProcessor(self.api_key)
             print(f"🔄 Dialog setting progress callback...")
-            self.processor.set_progress_callback(self.on_progress_update)
+            self.processor.set_progress_callback(
+                lambda phase, progress, message: self.on_progress_update(phase, progress, message, run_id)
+            )
             
             print(f"🔄 Dialog starting async processing...")
             # Start async processing
             self.processor.process_video_async(
                 self.video_path,
                 self.video_info,
-                self.on_processing_complete
+                lambda success, result, error: self.on_processing_complete(success, result, error, run_id)
             )
             print(f"🔄 Dialog async processing started")
             
         except Exception as e:
             print(f"❌ Dialog error starting processing: {str(e)}")
-            self.on_processing_complete(False, {}, str(e))
+            self.on_processing_complete(False, {}, str(e), run_id)
     
-    def test_ui_updates(self):
-        """Test if UI updates work at all"""
-        print(f"🧪 Testing UI updates...")
-        try:
-            # Test immediate update
-            self.phase_label.configure(text="Testing UI Updates...")
-            self.progress_bar.set(0.1)
-            self.progress_label.configure(text="10%")
-            self.status_label.configure(text="UI test in progress...")
-            self.update_idletasks()
-            self.update()
-            print(f"🧪 UI test update completed")
-            
-            # Schedule a reset after 1 second
-            def reset_ui():
-                self.phase_label.configure(text="Initializing...")
-                self.progress_bar.set(0)
-                self.progress_label.configure(text="0%")
-                self.status_label.configure(text="Starting AI analysis...")
-                self.update_idletasks()
-                print(f"🧪 UI reset completed")
-            
-            self.after(1000, reset_ui)
-            
-        except Exception as e:
-            print(f"❌ UI test failed: {str(e)}")
-    
-    def on_progress_update(self, phase: str, progress: float, message: str):
+    def on_progress_update(self, phase: str, progress: float, message: str, run_id: int):
         """Handle progress updates from processor - THREAD SAFE ONLY"""
-        print(f"📊 Dialog received progress update: phase={phase}, progress={progress:.1f}%, message='{message}'")
+        if DEBUG:
+            print(f"📊 Dialog received progress update: phase={phase}, progress={progress:.1f}%, message='{message}'")
         
-        if self.is_cancelled:
-            print(f"⚠️ Dialog ignoring progress update - cancelled")
+        if self.is_cancelled or run_id != self._run_id:
             return
         
+        # Drop near-duplicate updates from chatty producers (phase changes and
+        # completion always go through)
+        now = time.monotonic()
+        if (phase == self._last_enqueued_phase and phase != "complete" and
+                abs(progress - self._last_enqueued_progress) < PROGRESS_THROTTLE_DELTA and
+                now - self._last_enqueue_t < PROGRESS_THROTTLE_INTERVAL):
+            return
+        self._last_enqueue_t = now
+        self._last_enqueued_phase = phase
+        self._last_enqueued_progress = progress
+        
         # Use thread-safe queue instead of direct UI updates
-        print(f"📊 Dialog queuing UI update safely...")
         try:
             # Put update in queue - this is thread-safe
-            self.update_queue.put((phase, progress, message))
-            print(f"📊 Dialog UI update queued successfully")
+            self.update_queue.append((run_id, phase, progress, message))
+            self._wake_main_thread("<<ProgressUpdate>>")
         except Exception as e:
             print(f"❌ Dialog error queuing UI update: {str(e)}")
             # Do NOT attempt any fallback that touches UI directly
@@ -243,145 +360,108 @@ class LLMProgressDialog(ctk.CTkToplevel):
         print(f"🔄 Starting queue processing timer...")
         self.process_queue()
     
+    def _wake_main_thread(self, sequence: str):
+        """Post a virtual event so the main thread drains the queues (callable from any thread)"""
+        try:
+            self.event_generate(sequence, when="tail")
+        except (RuntimeError, tk.TclError):
+            pass  # Dialog gone or mainloop not running; the safety tick picks it up
+    
+    def _on_queue_event(self, event=None):
+        """Virtual event handler: draw queued updates immediately"""
+        self._process_pending_updates()
+    
     def process_queue(self):
-        """Process pending updates from the queue (main thread only)"""
+        """Safety-net timer: process pending updates and reschedule (main thread only)"""
+        self._process_pending_updates()
+        
+        if not self.is_cancelled:
+            self._queue_job = self.after(QUEUE_SAFETY_TICK_MS, self.process_queue)
+        else:
+            self._queue_job = None
+    
+    def _process_pending_updates(self):
+        """Process pending updates from the queues (main thread only)"""
         try:
-            # Process all pending progress updates
-            while True:
-                try:
-                    update_data = self.update_queue.get_nowait()
-                    phase, progress, message = update_data
-                    print(f"📥 Processing queued update: {phase}, {progress:.1f}%")
-                    self._safe_update_ui_progress(phase, progress, message)
-                except queue.Empty:
-                    break
+            # Drain everything queued since the last tick in one batch
+            # (an update checked just before a reset can still land here, so the
+            # run id is checked again)
+            pending = [update[1:] for update in self._drain(self.update_queue) if update[0] == self._run_id]
+            if pending:
+                # Coalesce into one redraw: last phase, furthest progress within that
+                # phase and the last non-empty message
+                phase = pending[-1][0]
+                progress = max(update[1] for update in pending if update[0] == phase)
+                message = next((update[2] for update in reversed(pending) if update[2]), "")
+                if DEBUG:
+                    print(f"📥 Processing {len(pending)} queued update(s): {phase}, {progress:.1f}%")
+                self._safe_update_ui_progress(phase, progress, message)
             
-            # Process completion updates
-            try:
-                completion_data = self.completion_queue.get_nowait()
-                success, result, error = completion_data
+            # Process completion updates (only the last one matters)
+            completions = [completion[1:] for completion in self._drain(self.completion_queue)
+                           if completion[0] == self._run_id]
+            if completions:
+                success, result, error = completions[-1]
                 print(f"📥 Processing queued completion: success={success}")
                 self._handle_completion(success, result, error)
-            except queue.Empty:
-                pass
                 
         except Exception as e:
             print(f"❌ Error processing queue: {str(e)}")
-        
-        # Schedule next queue check (every 100ms)
-        if not self.is_cancelled:
-            self.after(100, self.process_queue)
+    
+    @staticmethod
+    def _drain(pending_queue: deque) -> list:
+        """Take every item currently in a queue without blocking"""
+        items = []
+        try:
+            while True:
+                items.append(pending_queue.popleft())
+        except IndexError:
+            pass
+        return items
     
     def _safe_update_ui_progress(self, phase: str, progress: float, message: str):
         """THREAD-SAFE UI update method - ONLY call from main thread"""
-        print(f"🎨 Dialog SAFELY updating UI: phase={phase}, progress={progress:.1f}%")
+        if DEBUG:
+            print(f"🎨 Dialog updating UI: phase={phase}, progress={progress:.1f}%, message='{message}'")
         
-        if self.is_cancelled:
-            print(f"⚠️ Dialog ignoring UI update - cancelled")
+        if self.is_cancelled or not self._widgets_ready:
             return
         
         try:
-            # Check that widgets still exist before updating
-            if not hasattr(self, 'phase_label') or not hasattr(self, 'progress_bar'):
-                print(f"⚠️ Dialog widgets not available for update")
-                return
-            
             # Update phase
-            phase_text = PROGRESS_PHASES.get(phase, phase.replace("_", " ").title())
-            self.phase_label.configure(text=phase_text)
-            print(f"🎨 Phase label updated to: {phase_text}")
+            phase_text = PROGRESS_PHASES.get(phase)
+            if phase_text is None:
+                phase_text = phase.replace("_", " ").title()
+            if phase_text != self._last_phase_text:
+                self._last_phase_text = phase_text
+                self.phase_label.configure(text=phase_text)
             
-            # Update progress bar CAREFULLY
+            # Update progress bar CAREFULLY (skip changes too small to see, but always
+            # land exactly on the ends)
             progress_fraction = max(0.0, min(1.0, progress / 100.0))  # Clamp between 0 and 1
-            self.progress_bar.set(progress_fraction)
-            print(f"🎨 Progress bar set to: {progress_fraction:.2f}")
+            fraction_delta = abs(progress_fraction - self._last_progress_fraction)
+            if fraction_delta >= PROGRESS_BAR_MIN_DELTA or (
+                    fraction_delta > 0 and progress_fraction in (0.0, 1.0)):
+                self._last_progress_fraction = progress_fraction
+                self.progress_bar.set(progress_fraction)
             
             # Update percentage
-            self.progress_label.configure(text=f"{progress:.0f}%")
-            print(f"🎨 Progress percentage updated to: {progress:.0f}%")
+            progress_text = _PERCENT_TEXT[max(0, min(100, round(progress)))]
+            if progress_text != self._last_progress_text:
+                self._last_progress_text = progress_text
+                self.progress_label.configure(text=progress_text)
             
             # Update status message
-            if message:
+            if message and message != self._last_status_text:
+                self._last_status_text = message
                 self.status_label.configure(text=message)
-                print(f"🎨 Status message updated to: {message}")
-            
-            # Force UI refresh (this is safe on main thread)
-            self.update_idletasks()
-            print(f"🎨 UI refresh completed safely")
             
-            # Special handling for completion
-            if phase == "complete":
-                print(f"🎯 Dialog detected completion phase")
-                # Don't call on_analysis_complete directly, let completion_queue handle it
-                
+            # Completion is handled through completion_queue, not the "complete" phase
         except Exception as e:
             print(f"❌ CRITICAL: Error in safe UI update: {str(e)}")
             import traceback
             print(f"❌ Safe UI update traceback: {traceback.format_exc()}")
     
-    def _update_ui_progress(self, phase: str, progress: float, message: str):
-        """Update UI elements with progress (runs on main thread)"""
-        print(f"🎨 Dialog updating UI: phase={phase}, progress={progress:.1f}%")
-        
-        if self.is_cancelled:
-            print(f"⚠️ Dialog ignoring UI update - cancelled")
-            return
-        
-        try:
-            # Debug: Check if widgets exist
-            print(f"🎨 Checking widgets: phase_label={hasattr(self, 'phase_label')}, progress_bar={hasattr(self, 'progress_bar')}")
-            
-            # Update phase
-            phase_text = PROGRESS_PHASES.get(phase, phase.replace("_", " ").title())
-            if hasattr(self, 'phase_label'):
-                old_text = self.phase_label.cget("text")
-                self.phase_label.configure(text=phase_text)
-                new_text = self.phase_label.cget("text")
-                print(f"🎨 Phase label: '{old_text}' -> '{new_text}'")
-            
-            # Update progress bar
-            progress_fraction = progress / 100.0
-            if hasattr(self, 'progress_bar'):
-                old_progress = self.progress_bar.get()
-                self.progress_bar.set(progress_fraction)
-                new_progress = self.progress_bar.get()
-                print(f"🎨 Progress bar: {old_progress:.2f} -> {new_progress:.2f}")
-            
-            # Update percentage
-            if hasattr(self, 'progress_label'):
-                old_percent = self.progress_label.cget("text")
-                new_percent = f"{progress:.0f}%"
-                self.progress_label.configure(text=new_percent)
-                print(f"🎨 Progress label: '{old_percent}' -> '{new_percent}'")
-            
-            # Update status message
-            if message and hasattr(self, 'status_label'):
-                old_status = self.status_label.cget("text")
-                self.status_label.configure(text=message)
-                new_status = self.status_label.cget("text")
-                print(f"🎨 Status message: '{old_status}' -> '{new_status}'")
-            
-            # Force multiple types of UI refresh
-            print(f"🎨 Forcing UI refresh...")
-            self.update_idletasks()  # Process pending idle tasks
-            self.update()  # Process all pending events
-            print(f"🎨 UI refresh completed")
-            
-            # Check if values actually changed in UI
-            if hasattr(self, 'progress_bar'):
-                actual_progress = self.progress_bar.get()
-                print(f"🎨 Actual progress bar value after update: {actual_progress:.2f}")
-            
-            # Special handling for completion
-            if phase == "complete":
-                print(f"🎯 Dialog detected completion phase, triggering analysis complete")
-                self.on_analysis_complete()
-                
-        except Exception as e:
-            print(f"❌ Error updating UI: {str(e)}")
-            import traceback
-            print(f"❌ UI update traceback: {traceback.format_exc()}")
-    
     def on_analysis_complete(self):
         """Handle successful completion of analysis"""
         self.is_completed = True
@@ -397,27 +477,32 @@ class LLMProgressDialog(ctk.CTkToplevel):
         self.cancel_btn.grid_remove()
         self.close_btn.grid(row=0, column=0, padx=SPACING["sm"])
         
-        # Auto-close after 2 seconds
-        self.after(2000, self.auto_close)
+        # Auto-close after a short delay (or right away when no delay is configured)
+        if self.auto_close_delay_ms <= 0:
+            self.auto_close()
+        else:
+            self._close_job = self.after(self.auto_close_delay_ms, self.auto_close)
     
     def auto_close(self):
         """Auto-close dialog and proceed to main editor"""
+        self._close_job = None
         if not self.is_cancelled:
             self.on_close()
     
-    def on_processing_complete(self, success: bool, result: Optional[Dict], error: Optional[str]):
+    def on_processing_complete(self, success: bool, result: Optional[Dict], error: Optional[str], run_id: int):
         """Handle completion of processing - THREAD SAFE"""
         print(f"🎯 Dialog received processing completion: success={success}, has_result={result is not None}")
         
-        if self.is_cancelled:
-            print(f"⚠️ Dialog was cancelled, ignoring completion")
+        if self.is_cancelled or run_id != self._run_id:
+            print(f"⚠️ Dialog was cancelled or restarted, ignoring completion")
             return
         
         # Use thread-safe queue for completion
         print(f"🎯 Dialog queuing completion safely...")
         try:
-            self.completion_queue.put((success, result, error))
+            self.completion_queue.append((run_id, success, result, error))
             print(f"🎯 Dialog completion queued successfully")
+            self._wake_main_thread("<<ProgressComplete>>")
         except Exception as e:
             print(f"❌ Dialog error queuing completion: {str(e)}")
     
@@ -481,23 +566,29 @@ class LLMProgressDialog(ctk.CTkToplevel):
         self.status_label.configure(text="Cancelling analysis...")
         self.cancel_btn.configure(state="disabled")
         
-        # Close after short delay
-        self.after(1000, self.destroy)
+        # Hide after short delay
+        self._close_job = self.after(1000, self.hide)
     
     def on_close(self):
         """Handle close button - proceed with results"""
-        if hasattr(self, 'result') and self.result:
+        # Hide first so a callback that starts another analysis can reuse the dialog
+        self.hide()
+        
+        if self.result:
             # Call completion callback with results
             self.completion_callback(True, self.result)
         else:
             # Call completion callback with cancellation
             self.completion_callback(False, None)
-        
-        self.destroy()
+
+
+# Dialog kept hidden between analyses and reused by show_llm_progress_dialog
+_cached_dialog: Optional[LLMProgressDialog] = None
 
 
 # Convenience function for easy usage
-def show_llm_progress_dialog(parent, video_path: str, video_info: dict, api_key: Optional[str], completion_callback: Callable):
+def show_llm_progress_dialog(parent, video_path: str, video_info: dict, api_key: Optional[str], completion_callback: Callable,
+                             auto_close_delay_ms: int = 2000):
     """
     Show LLM progress dialog
     
@@ -507,6 +598,16 @@ def show_llm_progress_dialog(parent, video_path: str, video_info: dict, api_key:
         video_info: Video metadata
         api_key: OpenAI API key
         completion_callback: Function to call when complete (success: bool, result: dict)
+        auto_close_delay_ms: Delay before closing after success (<= 0 closes immediately)
     """
-    dialog = LLMProgressDialog(parent, video_path, video_info, api_key, completion_callback)
-    return dialog
+    global _cached_dialog
+    
+    # Reuse the hidden dialog of a previous analysis for the same parent
+    if (_cached_dialog is not None and _cached_dialog.master is parent and
+            _cached_dialog.winfo_exists() and _cached_dialog.state() == "withdrawn"):
+        _cached_dialog.reset(video_path, video_info, api_key, completion_callback, auto_close_delay_ms)
+    else:
+        _cached_dialog = LLMProgressDialog(
+            parent, video_path, video_info, api_key, completion_callback, auto_close_delay_ms
+        )
+    return _cached_dialog
@@ -22,15 +22,16 @@ class MainEditorComponent(ctk.CTkFrame):
         self.video_info = video_info
         self.thumbnail_cache = thumbnail_cache
         
+        # Show message if no cuts data available (the editor panels are never built)
+        if not self.cuts_data:
+            self.show_no_cuts_message()
+            return
+        
         # Setup UI first
         self.setup_ui()
         
         # Load initial data after UI is setup (so video is loaded first)
-        if self.cuts_data:
-            self.load_cuts_data()
-        else:
-            # Show message if no cuts data available
-            self.show_no_cuts_message()
+        self.load_cuts_data()
     
     def setup_ui(self):
         """Setup the main editor interface"""
@@ -81,10 +82,6 @@ class MainEditorComponent(ctk.CTkFrame):
     
     def show_no_cuts_message(self):
         """Show a message when no cuts data is available"""
-        # Clear existing content
-        for widget in self.winfo_children():
-            widget.destroy()
-        
         # Create message frame
         message_frame = ctk.CTkFrame(self, fg_color="transparent")
         message_frame.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=SPACING["lg"], pady=SPACING["lg"])
@@ -155,6 +152,6 @@ class MainEditorComponent(ctk.CTkFrame):
     
     def set_mock_data(self):
         """Set mock data for testing"""
-        mock_cuts = self.cuts_list.get_mock_cuts_data()
-        self.cuts_data = mock_cuts
+        # Mock cuts are shared read-only mappings; the editor mutates cuts in place
+        self.cuts_data = [dict(cut) for cut in self.cuts_list.get_mock_cuts_data()]
         self.load_cuts_data()
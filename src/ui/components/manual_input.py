@@ -4,18 +4,31 @@ Phase 2.3 - Manual Time Entry Interface with real functionality
 """
 
 import customtkinter as ctk
-import os
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-
-from src.utils.text_utils import parse_cuts_content, format_cuts_preview
+from ...utils.text_utils import parse_cuts_content, format_cuts_preview
 from ..styles.theme import get_frame_style, get_text_style, get_button_style, COLORS, SPACING
 
+# The parse result is picked up from the Tk main thread this often while it runs
+PARSE_POLL_MS = 30
+
+# Print a preview of the parsed cuts on each successful submit (off by default:
+# formatting and writing it to stdout runs on the Tk main thread)
+DEBUG = False
+
+# Example input shown in the text area until it gets focus
+_PLACEHOLDER_TEXT = (
+    "00:00:30 - 00:02:15 - Introduction - Welcome message and overview\n"
+    "00:02:15 - 00:05:30 - Main Topic - Core content explanation\n"
+    "00:05:30 - 00:08:45 - Examples - Practical demonstrations\n"
+    "00:08:45 - 00:10:00 - Conclusion - Summary and closing remarks\n"
+    "\n"
+    "Enter your timestamps here..."
+)
+
 class ManualInputComponent(ctk.CTkFrame):
-    def __init__(self, parent, on_process_complete=None, **kwargs):
+    def __init__(self, parent, on_process_complete=None, executor=None, **kwargs):
         super().__init__(parent, **kwargs)
         
         # Callback for when processing is complete
@@ -24,6 +37,13 @@ class ManualInputComponent(ctk.CTkFrame):
         # State
         self.is_processing = False
         self.processed_cuts_data = None
+        self._validate_job = None  # Pending debounced content check
+        self._parse_job = None  # Poll for the running parse
+        
+        # Parsing runs on a worker so large pastes don't freeze the UI; the app's
+        # shared executor is used when given, otherwise the component owns one
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="manual-input-parse")
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -87,13 +107,6 @@ class ManualInputComponent(ctk.CTkFrame):
         input_frame.grid_rowconfigure(0, weight=1)
         
         # Text area with placeholder
-        placeholder_text = """00:00:30 - 00:02:15 - Introduction - Welcome message and overview
-00:02:15 - 00:05:30 - Main Topic - Core content explanation
-00:05:30 - 00:08:45 - Examples - Practical demonstrations
-00:08:45 - 00:10:00 - Conclusion - Summary and closing remarks
-
-Enter your timestamps here..."""
-        
         self.text_area = ctk.CTkTextbox(
             input_frame,
             font=("Consolas", 14),
@@ -105,9 +118,11 @@ Enter your timestamps here..."""
         self.text_area.grid(row=0, column=0, sticky="nsew", padx=SPACING["md"], pady=SPACING["md"])
         
         # Insert placeholder text
-        self.text_area.insert("1.0", placeholder_text)
+        self.text_area.insert("1.0", _PLACEHOLDER_TEXT)
         self.text_area.bind("<FocusIn>", self.on_text_focus_in)
-        self.text_area.bind("<KeyPress>", self.on_text_change)
+        # KeyRelease sees the buffer after the key's edit (KeyPress runs before it)
+        self.text_area.bind("<KeyRelease>", self.on_text_change)
+        self.text_area.bind("<<Paste>>", self.on_text_paste)
         
         # Track if placeholder is active
         self.placeholder_active = True
@@ -160,7 +175,29 @@ Enter your timestamps here..."""
     
     def on_text_change(self, event):
         """Handle text change - update button state"""
-        # Simple validation - check if there's content
+        # Cheap emptiness check; the full content check is debounced
+        if self.placeholder_active or self.text_area.index("end-1c") == "1.0":
+            self._cancel_validate()
+            self.process_btn.configure(state="disabled")
+            return
+        
+        self._cancel_validate()
+        self._validate_job = self.after(150, self._validate_now)
+    
+    def on_text_paste(self, event):
+        """Handle paste - validate once after the pasted text is inserted"""
+        self._cancel_validate()
+        self._validate_job = self.after(150, self._validate_now)
+    
+    def _cancel_validate(self):
+        """Cancel a pending debounced content check"""
+        if self._validate_job is not None:
+            self.after_cancel(self._validate_job)
+            self._validate_job = None
+    
+    def _validate_now(self):
+        """Enable the process button if there's non-blank content"""
+        self._validate_job = None
         content = self.text_area.get("1.0", "end").strip()
         if content and not self.placeholder_active:
             self.process_btn.configure(state="normal")
@@ -174,6 +211,7 @@ Enter your timestamps here..."""
     
     def on_clear(self):
         """Handle clear button"""
+        self._cancel_validate()
         self.text_area.delete("1.0", "end")
         self.placeholder_active = False
         self.process_btn.configure(state="disabled")
@@ -191,8 +229,25 @@ Enter your timestamps here..."""
         self.is_processing = True
         self.process_btn.configure(text="Processing...", state="disabled")
         
-        # Use the central parser (same as file parsing)
-        is_valid, error_message, cuts_data = parse_cuts_content(content, "Manual Input")
+        # Use the central parser (same as file parsing), off the Tk main thread;
+        # the worker never calls into Tk, the result is polled for instead
+        future = self._executor.submit(parse_cuts_content, content, "Manual Input")
+        self._parse_job = self.after(PARSE_POLL_MS, self._poll_parse, future)
+    
+    def _poll_parse(self, future):
+        """Timer on the Tk thread: apply the parse result once the worker is done"""
+        if future.done():
+            self._parse_job = None
+            self._on_parse_done(future)
+        else:
+            self._parse_job = self.after(PARSE_POLL_MS, self._poll_parse, future)
+    
+    def _on_parse_done(self, future):
+        """Apply the parse result (runs on the Tk main thread)"""
+        if future.exception() is not None:
+            is_valid, error_message, cuts_data = False, f"Error parsing content: {future.exception()}", None
+        else:
+            is_valid, error_message, cuts_data = future.result()
         
         if not is_valid:
             self.is_processing = False
@@ -211,8 +266,8 @@ Enter your timestamps here..."""
         self.process_btn.configure(text="✅ Processed!", fg_color=COLORS["success"])
         
         # Show preview and proceed after delay
-        preview = format_cuts_preview(cuts_data)
-        print(f"📝 Manual input processed successfully!\n{preview}")
+        if DEBUG:
+            print(f"📝 Manual input processed successfully!\n{format_cuts_preview(cuts_data)}")
         
         self.after(2000, self.proceed_with_processed_data)
     
@@ -221,6 +276,12 @@ Enter your timestamps here..."""
         if self.on_process_complete and self.processed_cuts_data:
             self.on_process_complete("complete", self.processed_cuts_data)
     
-    def _complete_processing(self, content):
-        """Remove old simulation method"""
-        pass
+    def destroy(self):
+        """Stop the parse worker (if owned) before destroying the component"""
+        self._cancel_validate()
+        if self._parse_job is not None:
+            self.after_cancel(self._parse_job)
+            self._parse_job = None
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+        super().destroy()
@@ -3,13 +3,40 @@ Progress Dialog Component
 Real-time progress tracking for video export operations
 """
 
+import copy
+import re
 import customtkinter as ctk
 import tkinter.filedialog as filedialog
 import tkinter.messagebox as messagebox
-from typing import Optional, Dict, List
+from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, List
 from pathlib import Path
-from ..styles.theme import get_frame_style, get_text_style, get_button_style, COLORS, SPACING
-from ...core.video_processor import ThreadedVideoProcessor, VideoExportProgress
+from ..styles.theme import get_frame_style, get_text_style, get_button_style, get_font, COLORS, SPACING
+
+if TYPE_CHECKING:
+    from ...core.video_processor import VideoExportProgress
+
+# Import the processor on first use: the module pulls in ffmpeg, which the app
+# should not pay for at startup when no export is made
+@lru_cache(maxsize=1)
+def get_video_processor():
+    from ...core.video_processor import ThreadedVideoProcessor
+    return ThreadedVideoProcessor
+
+DIALOG_WIDTH, DIALOG_HEIGHT = 500, 350
+DEFAULT_OUTPUT_DIR = str(Path.home() / "Downloads")
+
+# Trace export start details to stdout (errors are always printed)
+DEBUG = False
+
+# "WxH+X+Y" as returned by winfo_geometry()
+_GEOMETRY_RE = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
+
+# Progress posted by the export thread is drawn at most once per tick
+PROGRESS_TICK_MS = 60
+PROGRESS_IDLE_TICK_MS = 250  # Slower tick while the bar has caught up with the export
+PROGRESS_BAR_MAX_STEP = 0.02  # Bar glides toward the reported progress by at most this per tick
 
 
 class ProgressDialog(ctk.CTkToplevel):
@@ -22,29 +49,43 @@ class ProgressDialog(ctk.CTkToplevel):
         self.video_path = video_path
         self.cut_data = cut_data  # For single export
         self.cuts_data = cuts_data  # For batch export
-        self.output_dir = output_dir or str(Path.home() / "Downloads")
+        self.output_dir = output_dir or DEFAULT_OUTPUT_DIR
         self.quality = quality
         
         # Determine export type
         self.export_type = "single" if cut_data else "batch"
         self.total_files = 1 if self.export_type == "single" else len(cuts_data or [])
         
-        # Initialize video processor - use synchronous version for now to avoid segfault
-        from ...core.video_processor import VideoProcessor
-        self.processor = VideoProcessor()
-        self.processor.set_progress_callback(self.update_progress)
-        self.processor.set_completion_callback(self.export_completed)
+        # Export runs on a worker thread. Its callbacks never touch Tk: they only post
+        # the latest state, which a timer on the Tk thread draws
+        self.processor = get_video_processor()()
+        self.processor.set_progress_callback(self._post_progress)
+        self.processor.set_completion_callback(self._post_completion)
+        self._progress_updates = deque(maxlen=1)  # Only the latest snapshot matters
+        self._completions = deque(maxlen=1)
+        self._drain_job = None
+        self._start_job = None
+        self._export_runners = {"single": self.run_single_export, "batch": self.run_batch_export}
+        self._counter_fmt = f"File {{}} of {self.total_files}"
+        
+        # The bar is interpolated toward the last reported progress on each tick
+        self._target_progress = 0.0
+        self._displayed_progress = 0.0
+        
+        # Last drawn values, so labels are only reconfigured when they change
+        self._last_percent = -1
+        self._last_file_index = -1
+        self._last_file_text = None
+        self._last_time_text = None
         
         # UI state
         self.is_completed = False
         self.is_cancelled = False
+        self._ui_built = False
         
-        # Configure window
+        # Configure window (sections are built by show(), once there is an export to track)
         self.setup_window()
         
-        # Setup UI
-        self.setup_ui()
-        
         # Select output directory before starting
         self.select_output_directory()
 
@@ -52,10 +93,9 @@ class ProgressDialog(ctk.CTkToplevel):
         """Configure the progress window"""
         title = f"Exporting {'1 Cut' if self.export_type == 'single' else f'{self.total_files} Cuts'}"
         self.title(title)
-        self.geometry("500x350")
         self.resizable(False, False)
         
-        # Center on parent
+        # Size and center on parent
         self.center_on_parent()
         
         # Make modal
@@ -70,20 +110,24 @@ class ProgressDialog(ctk.CTkToplevel):
         self.protocol("WM_DELETE_WINDOW", self.on_close_window)
 
     def center_on_parent(self):
-        """Center the dialog on the parent window"""
-        self.update_idletasks()
-        
-        # Get parent window position and size
-        parent_x = self.master.winfo_x()
-        parent_y = self.master.winfo_y()
-        parent_width = self.master.winfo_width()
-        parent_height = self.master.winfo_height()
-        
-        # Calculate center position
-        x = parent_x + (parent_width // 2) - (250)
-        y = parent_y + (parent_height // 2) - (175)
-        
-        self.geometry(f"500x350+{x}+{y}")
+        """Size the dialog and center it on the parent window"""
+        # One winfo_geometry() round-trip instead of four winfo_* calls; the
+        # parent is already mapped, so no idle pass is needed first
+        match = _GEOMETRY_RE.match(self.master.winfo_geometry())
+        if not match:
+            self.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}")
+            return
+        
+        parent_width, parent_height, parent_x, parent_y = map(int, match.groups())
+        x = parent_x + (parent_width - DIALOG_WIDTH) // 2
+        y = parent_y + (parent_height - DIALOG_HEIGHT) // 2
+        self.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
+
+    def show(self):
+        """Build the dialog sections on first use"""
+        if not self._ui_built:
+            self.setup_ui()
+            self._ui_built = True
 
     def setup_ui(self):
         """Setup the progress dialog UI"""
@@ -108,14 +152,13 @@ class ProgressDialog(ctk.CTkToplevel):
         icon_label = ctk.CTkLabel(
             header_frame,
             text="🎬",
-            font=("Segoe UI", 32)
+            font=get_font("Segoe UI", 32)
         )
         icon_label.grid(row=0, column=0, padx=SPACING["lg"], pady=SPACING["md"])
         
         # Title and subtitle
         title_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
         title_frame.grid(row=0, column=1, sticky="ew", padx=SPACING["md"], pady=SPACING["md"])
-        title_frame.grid_columnconfigure(0, weight=1)
         
         title_style = get_text_style("header")
         title_text = "Export Video Cut" if self.export_type == "single" else f"Export {self.total_files} Video Cuts"
@@ -150,7 +193,7 @@ class ProgressDialog(ctk.CTkToplevel):
         self.percentage_label = ctk.CTkLabel(
             progress_frame,
             text="0%",
-            font=("Segoe UI", 18, "bold"),
+            font=get_font("Segoe UI", 18, "bold"),
             text_color=COLORS["accent"]
         )
         self.percentage_label.grid(row=1, column=0, pady=(0, SPACING["md"]))
@@ -159,7 +202,7 @@ class ProgressDialog(ctk.CTkToplevel):
         self.current_file_label = ctk.CTkLabel(
             progress_frame,
             text="Initializing...",
-            font=("Segoe UI", 14),
+            font=get_font("Segoe UI", 14),
             text_color=COLORS["text"]
         )
         self.current_file_label.grid(row=2, column=0, pady=(0, SPACING["sm"]))
@@ -168,7 +211,7 @@ class ProgressDialog(ctk.CTkToplevel):
         self.file_counter_label = ctk.CTkLabel(
             progress_frame,
             text=f"File 0 of {self.total_files}",
-            font=("Segoe UI", 12),
+            font=get_font("Segoe UI", 12),
             text_color=COLORS["text_secondary"]
         )
         self.file_counter_label.grid(row=3, column=0, pady=(0, SPACING["sm"]))
@@ -177,7 +220,7 @@ class ProgressDialog(ctk.CTkToplevel):
         self.time_estimate_label = ctk.CTkLabel(
             progress_frame,
             text="Calculating time remaining...",
-            font=("Segoe UI", 12),
+            font=get_font("Segoe UI", 12),
             text_color=COLORS["text_secondary"]
         )
         self.time_estimate_label.grid(row=4, column=0, pady=(0, SPACING["lg"]))
@@ -197,7 +240,17 @@ class ProgressDialog(ctk.CTkToplevel):
             command=self.on_cancel,
             **cancel_btn_style
         )
-        self.cancel_btn.grid(row=0, column=0, padx=SPACING["md"], pady=SPACING["md"])
+        self.cancel_btn.grid(row=1, column=0, padx=SPACING["md"], pady=(SPACING["xs"], SPACING["md"]))
+        
+        # Completion banner (shown inline instead of a modal messagebox)
+        self.status_banner = ctk.CTkLabel(
+            controls_frame,
+            text="",
+            font=get_font("Segoe UI", 12),
+            wraplength=DIALOG_WIDTH - 4 * SPACING["lg"]
+        )
+        self.status_banner.grid(row=0, column=0, sticky="ew")
+        self.status_banner.grid_remove()
 
     def select_output_directory(self):
         """Let user select output directory before starting export"""
@@ -209,6 +262,7 @@ class ProgressDialog(ctk.CTkToplevel):
         
         if selected_dir:
             self.output_dir = selected_dir
+            self.show()
             self.start_export()
         else:
             # User cancelled directory selection
@@ -217,26 +271,18 @@ class ProgressDialog(ctk.CTkToplevel):
     def start_export(self):
         """Start the export process"""
         try:
-            if self.export_type == "single" and self.cut_data:
-                print(f"🎬 Starting single cut export...")
-                print(f"Video: {self.video_path}")
-                print(f"Cut data: {self.cut_data}")
-                print(f"Output dir: {self.output_dir}")
-                
-                # Run export synchronously but with UI updates
-                self.after(100, self.run_single_export)
-            
-            elif self.export_type == "batch" and self.cuts_data:
-                print(f"🎬 Starting batch export...")
-                print(f"Video: {self.video_path}")
-                print(f"Cuts count: {len(self.cuts_data)}")
-                print(f"Output dir: {self.output_dir}")
-                
-                # Run export synchronously but with UI updates
-                self.after(100, self.run_batch_export)
-            else:
+            runner = self._export_runners.get(self.export_type)
+            export_data = self.cut_data if self.export_type == "single" else self.cuts_data
+            if runner is None or not export_data:
                 messagebox.showerror("Error", "No valid export data provided")
                 self.on_close_window()
+                return
+            
+            if DEBUG:
+                print(f"🎬 Starting {self.export_type} export of {self.total_files} cut(s): {self.video_path} -> {self.output_dir}")
+            
+            # Start the export on the worker thread as soon as the dialog is drawn
+            self._start_job = self.after_idle(runner)
                 
         except Exception as e:
             print(f"❌ Error starting export: {e}")
@@ -246,65 +292,99 @@ class ProgressDialog(ctk.CTkToplevel):
             self.on_close_window()
     
     def run_single_export(self):
-        """Run single export synchronously"""
-        try:
-            success = self.processor.export_single_cut(
-                self.video_path,
-                self.cut_data,
-                self.output_dir,
-                self.quality
-            )
-            if success:
-                print("✅ Single export completed successfully")
-            else:
-                print("❌ Single export failed")
-        except Exception as e:
-            print(f"❌ Error in single export: {e}")
-            import traceback
-            traceback.print_exc()
+        """Run single export on the worker thread"""
+        self._start_job = None
+        if self.processor.export_single_cut_async(
+            self.video_path,
+            self.cut_data,
+            self.output_dir,
+            self.quality
+        ):
+            self._drain_job = self.after(PROGRESS_TICK_MS, self._drain_progress)
+        else:
+            print("❌ Another export is already running")
     
     def run_batch_export(self):
-        """Run batch export synchronously"""
+        """Run batch export on the worker thread"""
+        self._start_job = None
+        if self.processor.export_batch_cuts_async(
+            self.video_path,
+            self.cuts_data,
+            self.output_dir,
+            self.quality
+        ):
+            self._drain_job = self.after(PROGRESS_TICK_MS, self._drain_progress)
+        else:
+            print("❌ Another export is already running")
+    
+    def _post_progress(self, progress: "VideoExportProgress"):
+        """Export thread callback: keep a snapshot of the latest progress"""
+        self._progress_updates.append(copy.copy(progress))
+    
+    def _post_completion(self, success: bool, message: str):
+        """Export thread callback: keep the completion for the Tk thread"""
+        self._completions.append((success, message))
+    
+    def _drain_progress(self):
+        """Timer on the Tk thread: draw the latest posted progress, then any completion"""
+        self._drain_job = None
         try:
-            success = self.processor.export_batch_cuts(
-                self.video_path,
-                self.cuts_data,
-                self.output_dir,
-                self.quality
-            )
-            if success:
-                print("✅ Batch export completed successfully")
-            else:
-                print("❌ Batch export failed")
-        except Exception as e:
-            print(f"❌ Error in batch export: {e}")
-            import traceback
-            traceback.print_exc()
+            self.update_progress(self._progress_updates.pop())
+        except IndexError:
+            pass
+        
+        try:
+            success, message = self._completions.pop()
+        except IndexError:
+            delay = PROGRESS_TICK_MS if self._step_progress_bar() else PROGRESS_IDLE_TICK_MS
+            self._drain_job = self.after(delay, self._drain_progress)
+            return
+        self.export_completed(success, message)
+    
+    def _step_progress_bar(self) -> bool:
+        """Move the bar one step toward the target progress; False once it has caught up"""
+        remaining = self._target_progress - self._displayed_progress
+        if remaining == 0:
+            return False
+        if abs(remaining) <= PROGRESS_BAR_MAX_STEP:
+            self._displayed_progress = self._target_progress
+        else:
+            self._displayed_progress += PROGRESS_BAR_MAX_STEP if remaining > 0 else -PROGRESS_BAR_MAX_STEP
+        self.progress_bar.set(self._displayed_progress)
+        return True
 
-    def update_progress(self, progress: VideoExportProgress):
+    def update_progress(self, progress: "VideoExportProgress"):
         """Update UI with current progress"""
-        # Update progress bar and percentage
-        self.progress_bar.set(progress.progress_percent / 100.0)
-        self.percentage_label.configure(text=f"{int(progress.progress_percent)}%")
-        
-        # Update current file
-        if progress.current_file:
-            self.current_file_label.configure(text=f"Processing: {progress.current_file}")
+        # Update progress bar target (drawn by _drain_progress) and percentage
+        self._target_progress = progress.progress_percent / 100.0
+        percent = int(progress.progress_percent)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.percentage_label.configure(text=f"{percent}%")
+        
+        # Update current file (status-specific text takes precedence)
+        file_text = self._last_file_text
+        if progress.status == "error":
+            file_text = f"❌ Error: {progress.error_message}"
+        elif progress.status == "cancelled":
+            file_text = "❌ Export Cancelled"
+        elif progress.current_file:
+            file_text = f"Processing: {progress.current_file}"
+        if file_text != self._last_file_text:
+            self._last_file_text = file_text
+            self.current_file_label.configure(text=file_text)
         
         # Update file counter
-        self.file_counter_label.configure(text=f"File {progress.current_index} of {progress.total_files}")
+        if progress.current_index != self._last_file_index:
+            self._last_file_index = progress.current_index
+            self.file_counter_label.configure(text=self._counter_fmt.format(progress.current_index))
         
         # Update time estimate
         if progress.estimated_time_remaining > 0:
-            self.time_estimate_label.configure(
-                text=f"Estimated time remaining: {progress.estimated_time_remaining}s"
-            )
-        
-        # Update status-specific UI
-        if progress.status == "error":
-            self.current_file_label.configure(text=f"❌ Error: {progress.error_message}")
-        elif progress.status == "cancelled":
-            self.current_file_label.configure(text="❌ Export Cancelled")
+            time_text = f"Estimated time remaining: {progress.estimated_time_remaining}s"
+            if time_text != self._last_time_text:
+                self._last_time_text = time_text
+                self.time_estimate_label.configure(text=time_text)
 
     def export_completed(self, success: bool, message: str):
         """Handle export completion"""
@@ -317,20 +397,27 @@ class ProgressDialog(ctk.CTkToplevel):
             self.file_counter_label.configure(text=f"All {self.total_files} files processed")
             self.time_estimate_label.configure(text=message)
             
-            # Update button
-            self.cancel_btn.configure(text="Close", command=self.on_close_window)
-            
-            # Show success message
-            messagebox.showinfo("Export Complete", f"{message}\n\nFiles saved to:\n{self.output_dir}")
-            
-            # Keep dialog open with Close button (removed auto-close)
+            # Show where the files went (dialog stays open with the Close button)
+            self.show_status_banner(f"Files saved to: {self.output_dir}", COLORS["success"])
+        elif self.is_cancelled:
+            # The export stopped because the user asked it to, not because it failed
+            self.current_file_label.configure(text="⏹️ Export Cancelled")
+            self.time_estimate_label.configure(text="")
+            self.show_status_banner("Export cancelled", COLORS["warning"])
         else:
             self.current_file_label.configure(text=f"❌ Export Failed")
-            self.time_estimate_label.configure(text=message)
-            self.cancel_btn.configure(text="Close", command=self.on_close_window)
+            self.time_estimate_label.configure(text="")
             
             # Show error message
-            messagebox.showerror("Export Failed", message)
+            self.show_status_banner(message, COLORS["error"])
+        
+        # Turn Cancel into Close (re-enabled, since a cancel request disables it)
+        self.cancel_btn.configure(text="Close", command=self.on_close_window, state="normal")
+
+    def show_status_banner(self, text: str, color: str):
+        """Show a completion message inline above the Close button"""
+        self.status_banner.configure(text=text, text_color=color)
+        self.status_banner.grid()
 
     def on_cancel(self):
         """Handle cancel button"""
@@ -349,8 +436,20 @@ class ProgressDialog(ctk.CTkToplevel):
             # Ask for confirmation if export is running
             if messagebox.askyesno("Cancel Export", "Export is in progress. Are you sure you want to cancel?"):
                 self.processor.cancel_export()
-                self.grab_release()
-                self.destroy()
+                self._close()
         else:
-            self.grab_release()
-            self.destroy()
\ No newline at end of file
+            self._close()
+    
+    def _close(self):
+        """Stop drawing progress and destroy the dialog"""
+        self._cancel_jobs()
+        self.grab_release()
+        self.destroy()
+    
+    def _cancel_jobs(self):
+        """Cancel the delayed export start and the progress drain, so none fire after close"""
+        for job in (self._start_job, self._drain_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._start_job = None
+        self._drain_job = None
@@ -7,26 +7,26 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
-import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+from ...utils.data_cache import DataCacheManager
+from ..styles.theme import COLORS, FONTS, SPACING, get_frame_style, get_text_style, get_button_style, get_font
 
-from src.utils.video_utils import validate_and_extract_metadata
-from src.utils.data_cache import DataCacheManager
-from ..styles.theme import COLORS, FONTS, SPACING, get_frame_style, get_text_style, get_button_style
+# File picker options (resolved once at import)
+_VIDEO_FILETYPES = (("MP4 files", "*.mp4"), ("All files", "*.*"))
+_HOME_DIR = os.path.expanduser("~")
 
-# Try to import drag and drop - completely optional
-try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
-    HAS_DND = True
-    print("✅ Drag & Drop support available")
-except ImportError:
-    HAS_DND = False
-    print("⚠️ Drag & Drop not available - using click-to-select only")
+# Time the success state stays visible before moving on to the next phase
+PROCEED_DELAY_MS = 150
+
+# The probe result is picked up from the Tk main thread this often while it runs
+PROBE_POLL_MS = 30
+
+# Trace video loading and cache lookups to stdout (errors are always printed)
+DEBUG = False
 
 class VideoLoaderComponent(ctk.CTkFrame):
-    def __init__(self, parent, on_video_loaded=None, **kwargs):
+    def __init__(self, parent, on_video_loaded=None, executor=None, **kwargs):
         super().__init__(parent, **kwargs)
         
         # Callback for when video is loaded
@@ -35,9 +35,17 @@ class VideoLoaderComponent(ctk.CTkFrame):
         # Initialize cache manager
         self.cache_manager = DataCacheManager()
         
+        # Metadata is probed on a worker so the UI keeps responding; the app's
+        # shared executor is used when given, otherwise the component owns one
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="video-probe")
+        self._probe_job = None  # Poll for the running probe
+        
         # State
         self.is_processing = False
         self.loaded_video_info = None
+        self._hovered = False  # Drop area currently drawn with the hover border
+        self._last_dir = None  # Folder of the last picked video, reopened by the file picker
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -51,22 +59,22 @@ class VideoLoaderComponent(ctk.CTkFrame):
         """Create the main drag and drop area"""
         # Main drop area frame
         drop_frame_style = get_frame_style("card")
+        # Sized by its grid cell (sticky nsew in a weighted row/column), so it
+        # needs neither a fixed height nor grid_propagate(False)
         self.drop_area = ctk.CTkFrame(
             self,
-            height=400,
             **drop_frame_style
         )
         self.drop_area.grid(row=0, column=0, sticky="nsew", padx=SPACING["xl"], pady=SPACING["xl"])
         self.drop_area.grid_columnconfigure(0, weight=1)
         self.drop_area.grid_rowconfigure((0, 1, 2, 3, 4, 5), weight=1)
-        self.drop_area.grid_propagate(False)
         
         # Video icon (using text for now - we can add real icon later)
         icon_style = get_text_style("large_header")
         self.video_icon = ctk.CTkLabel(
             self.drop_area,
             text="🎬",
-            font=(FONTS["main"][0], 64),
+            font=get_font(FONTS["main"][0], 64),
             **{k: v for k, v in icon_style.items() if k != 'font'}
         )
         self.video_icon.grid(row=1, column=0, pady=(SPACING["lg"], SPACING["sm"]))
@@ -103,17 +111,22 @@ class VideoLoaderComponent(ctk.CTkFrame):
             self.drop_area,
             text="",
             text_color="green",
-            font=(FONTS["main"][0], 12, "bold")
+            font=get_font(FONTS["main"][0], 12, "bold")
         )
         self.status_label.grid(row=5, column=0, pady=SPACING["sm"])
         self.status_label.grid_remove()  # Hide initially
         
-        # Make the entire drop area clickable
-        self.drop_area.bind("<Button-1>", lambda e: self.handle_click_to_select())
+        # The drop area and its labels share one bindtag, so click and hover are
+        # bound once for all of them instead of per widget
+        self._drop_tag = f"droparea{id(self)}"
+        for widget in (self.drop_area, self.video_icon, self.title_label, self.instruction_label, self.format_label):
+            # CTk widgets receive events on their inner Tk canvas/label, not on the outer frame
+            for part in widget.winfo_children():
+                if not isinstance(part, ctk.CTkBaseClass):
+                    part.bindtags(part.bindtags() + (self._drop_tag,))
         
-        # Bind click events to all child widgets too
-        for widget in [self.video_icon, self.title_label, self.instruction_label, self.format_label]:
-            widget.bind("<Button-1>", lambda e: self.handle_click_to_select())
+        # Make the entire drop area clickable
+        self.drop_area.bind_class(self._drop_tag, "<Button-1>", lambda e: self.handle_click_to_select())
         
         # Bind hover events for visual feedback
         self.bind_hover_events()
@@ -122,33 +135,45 @@ class VideoLoaderComponent(ctk.CTkFrame):
         """Setup drag and drop functionality (if available)"""
         # For now, we'll disable drag and drop to ensure compatibility
         # Click-to-select will work on all systems
-        print("📋 Drag & Drop temporarily disabled - using click-to-select")
+        if DEBUG:
+            print("📋 Drag & Drop temporarily disabled - using click-to-select")
         return
         
         # TODO: Implement proper drag & drop for CustomTkinter when stable
         # This would require integrating tkinterdnd2 with CustomTkinter's widget hierarchy
+        # (import it here, not at module level, when re-enabling)
         
     def bind_hover_events(self):
         """Bind hover events for visual feedback"""
-        # Hover effects for the drop area
-        self.drop_area.bind("<Enter>", self.on_hover_enter)
-        self.drop_area.bind("<Leave>", self.on_hover_leave)
-        
-        # Bind to child widgets too
-        for widget in [self.video_icon, self.title_label, self.instruction_label, self.format_label]:
-            widget.bind("<Enter>", self.on_hover_enter)
-            widget.bind("<Leave>", self.on_hover_leave)
+        # Hover effects for the drop area and its labels (through the shared bindtag)
+        self.drop_area.bind_class(self._drop_tag, "<Enter>", self.on_hover_enter)
+        self.drop_area.bind_class(self._drop_tag, "<Leave>", self.on_hover_leave)
     
     def on_hover_enter(self, event):
         """Handle hover enter event"""
-        self.drop_area.configure(border_color=COLORS["accent"])
-        self.drop_area.configure(border_width=2)
+        # Enter fires again for each label the pointer crosses; only restyle once
+        if not self._hovered:
+            self._hovered = True
+            self.drop_area.configure(border_color=COLORS["accent"], border_width=2)
         
     def on_hover_leave(self, event):
         """Handle hover leave event"""
-        if not self.is_processing:
-            self.drop_area.configure(border_color=COLORS["border"])
-            self.drop_area.configure(border_width=1)
+        # Leave fires on the area before Enter fires on a label inside it, so only
+        # restyle when the pointer has really left the drop area
+        if self._hovered and not self.is_processing and not self._pointer_in_drop_area(event):
+            self._hovered = False
+            self.drop_area.configure(border_color=COLORS["border"], border_width=1)
+    
+    def _pointer_in_drop_area(self, event) -> bool:
+        """Whether the pointer is over the drop area or one of its children"""
+        try:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+        except (KeyError, tk.TclError):
+            return False  # Over a widget tkinter doesn't know (e.g. another window)
+        if widget is None:
+            return False
+        area_path, widget_path = str(self.drop_area), str(widget)
+        return widget_path == area_path or widget_path.startswith(area_path + ".")
     
     def _check_cache_status(self, video_path: str) -> tuple[bool, bool]:
         """
@@ -180,11 +205,12 @@ class VideoLoaderComponent(ctk.CTkFrame):
             
         file_path = filedialog.askopenfilename(
             title="Select MP4 Video File",
-            filetypes=[("MP4 files", "*.mp4"), ("All files", "*.*")],
-            initialdir=os.path.expanduser("~")
+            filetypes=_VIDEO_FILETYPES,
+            initialdir=self._last_dir or _HOME_DIR
         )
         
         if file_path:
+            self._last_dir = os.path.dirname(file_path)
             self.process_video_file(file_path)
     
     def handle_drop_event(self, event):
@@ -210,8 +236,32 @@ class VideoLoaderComponent(ctk.CTkFrame):
         self.is_processing = True
         self.update_ui_state("processing")
         
-        # Validate and extract metadata in one efficient operation
-        is_valid, error_message, metadata = validate_and_extract_metadata(file_path)
+        # Validate and extract metadata in one efficient operation, off the Tk main
+        # thread; the worker never calls into Tk, the result is polled for instead
+        future = self._executor.submit(self._probe_video, file_path)
+        self._probe_job = self.after(PROBE_POLL_MS, self._poll_probe, future)
+    
+    @staticmethod
+    def _probe_video(file_path):
+        """Worker thread: validate the file and extract its metadata"""
+        # video_utils pulls in OpenCV, so it is imported on first use
+        from ...utils.video_utils import validate_and_extract_metadata
+        return validate_and_extract_metadata(file_path)
+    
+    def _poll_probe(self, future):
+        """Timer on the Tk thread: apply the probe result once the worker is done"""
+        if future.done():
+            self._probe_job = None
+            self._on_probe_done(future)
+        else:
+            self._probe_job = self.after(PROBE_POLL_MS, self._poll_probe, future)
+    
+    def _on_probe_done(self, future):
+        """Apply the probe result (runs on the Tk main thread)"""
+        if future.exception() is not None:
+            is_valid, error_message, metadata = False, f"Error processing video file: {future.exception()}", None
+        else:
+            is_valid, error_message, metadata = future.result()
         
         if not is_valid:
             self.is_processing = False
@@ -231,8 +281,8 @@ class VideoLoaderComponent(ctk.CTkFrame):
         self.loaded_video_info = metadata
         self.update_ui_state("success")
         
-        # Proceed to next phase after a short delay
-        self.after(1500, self.proceed_to_next_phase)
+        # Proceed to next phase after a short transition
+        self.after(PROCEED_DELAY_MS, self.proceed_to_next_phase)
     
     def update_ui_state(self, state, message=""):
         """Update UI based on current state"""
@@ -256,8 +306,8 @@ class VideoLoaderComponent(ctk.CTkFrame):
             self.video_icon.configure(text="❌")
     
     def reset_ui_state(self):
-        """Reset UI to initial state"""
-        self.after(3000, self._reset_ui_elements)
+        """Reset UI to initial state (the error dialog has already been dismissed)"""
+        self._reset_ui_elements()
     
     def _reset_ui_elements(self):
         """Reset UI elements to initial state"""
@@ -279,7 +329,8 @@ class VideoLoaderComponent(ctk.CTkFrame):
         
         if has_cuts:
             # Cargar cuts desde caché y ir directo al editor
-            print("🎯 Cuts cache found! Loading existing cuts...")
+            if DEBUG:
+                print("🎯 Cuts cache found! Loading existing cuts...")
             try:
                 cached_cuts = self.cache_manager.load_cuts(video_path)
                 
@@ -297,7 +348,8 @@ class VideoLoaderComponent(ctk.CTkFrame):
                 
         elif has_transcription:
             # Hay transcripción disponible
-            print("📝 Transcription cache found!")
+            if DEBUG:
+                print("📝 Transcription cache found!")
             self._show_cache_status("⚡ Transcripción disponible - Análisis será más rápido")
             
             # Continuar al flujo normal pero con flag de transcripción disponible
@@ -305,34 +357,18 @@ class VideoLoaderComponent(ctk.CTkFrame):
             
         else:
             # Sin caché, flujo normal
-            print("🔄 No cache found. Will process from scratch...")
+            if DEBUG:
+                print("🔄 No cache found. Will process from scratch...")
             self._show_cache_status("")
             self.on_video_loaded(self.loaded_video_info)
-
-if __name__ == "__main__":
-    # Test the component
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-    
-    from styles.theme import apply_theme
-    
-    # Create root window with drag and drop support
-    try:
-        from tkinterdnd2 import TkinterDnD
-        root = TkinterDnD.Tk()
-    except ImportError:
-        root = ctk.CTk()
-        print("Warning: tkinterdnd2 not available, drag and drop disabled")
-    
-    apply_theme()
-    root.title("Video Loader Test")
-    root.geometry("800x600")
-    
-    def on_video_loaded(video_info):
-        print(f"Video loaded: {video_info}")
-    
-    loader = VideoLoaderComponent(root, on_video_loaded=on_video_loaded)
-    loader.pack(fill="both", expand=True, padx=20, pady=20)
     
-    root.mainloop()
+    def destroy(self):
+        """Drop the drop area's class bindings (they outlive the widgets) and stop the probe worker (if owned)"""
+        for sequence in ("<Button-1>", "<Enter>", "<Leave>"):
+            self.unbind_class(self._drop_tag, sequence)
+        if self._probe_job is not None:
+            self.after_cancel(self._probe_job)
+            self._probe_job = None
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+        super().destroy()
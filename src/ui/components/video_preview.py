@@ -11,6 +11,9 @@ import time
 from PIL import Image, ImageTk
 from ..styles.theme import get_frame_style, get_text_style, get_button_style, COLORS, SPACING
 
+# Cut selections arriving within this window are drawn once (e.g. arrow-key repeat in the list)
+CUT_INFO_FLUSH_MS = 40
+
 class VideoPreviewComponent(ctk.CTkFrame):
     def __init__(self, parent, thumbnail_cache=None, **kwargs):
         super().__init__(parent, **kwargs)
@@ -21,6 +24,8 @@ class VideoPreviewComponent(ctk.CTkFrame):
         
         # Current selected cut data
         self.selected_cut = None
+        self._pending_cut = None  # Latest cut waiting to be drawn by _flush_cut_info
+        self._cut_info_job = None
         
         # Video data
         self.video_path: Optional[str] = None
@@ -242,8 +247,8 @@ class VideoPreviewComponent(ctk.CTkFrame):
         # Toggle header
         self.create_info_toggle_header()
         
-        # Content frame (initially hidden)
-        self.create_info_content()
+        # Content frame (initially hidden): built the first time the panel is expanded
+        self.info_content_frame = None
         
         # Initially hide content
         self.toggle_info_panel(show=False)
@@ -276,6 +281,9 @@ class VideoPreviewComponent(ctk.CTkFrame):
         # Time information and cut details
         self.create_time_info(self.info_content_frame)
         self.create_cut_details(self.info_content_frame)
+        
+        # Show the cut that was selected while the panel was still collapsed
+        self._fill_cut_info(self.selected_cut)
     
     def toggle_info_panel(self, show=None):
         """Toggle the info panel visibility"""
@@ -285,10 +293,14 @@ class VideoPreviewComponent(ctk.CTkFrame):
             self.info_panel_expanded = show
             
         if self.info_panel_expanded:
-            self.info_content_frame.grid()
+            if self.info_content_frame is None:
+                self.create_info_content()
+            else:
+                self.info_content_frame.grid()
             self.info_toggle_btn.configure(text="▼ Cut Information")
         else:
-            self.info_content_frame.grid_remove()
+            if self.info_content_frame is not None:
+                self.info_content_frame.grid_remove()
             self.info_toggle_btn.configure(text="▶ Cut Information")
     
     def on_toggle_info(self):
@@ -1798,37 +1810,65 @@ class VideoPreviewComponent(ctk.CTkFrame):
     
     def update_cut_info(self, cut_data):
         """Update the cut information panel with new cut data"""
+        # The selection itself is immediate; the panel and preview frame are drawn
+        # at most once per CUT_INFO_FLUSH_MS, for the latest cut
+        self.selected_cut = cut_data or None
+        self._pending_cut = self.selected_cut
+        if self._cut_info_job is None:
+            self._cut_info_job = self.after(CUT_INFO_FLUSH_MS, self._flush_cut_info)
+    
+    def _flush_cut_info(self):
+        """Draw the latest selected cut into the info panel and the preview"""
+        self._cut_info_job = None
+        cut_data = self._pending_cut
+        self._fill_cut_info(cut_data)
+        
         if cut_data:
-            self.selected_cut = cut_data
-            
-            # Update time labels
-            start_time = cut_data.get("start_time", cut_data.get("start", "00:00:00"))
-            end_time = cut_data.get("end_time", cut_data.get("end", "00:00:00"))
-            
-            self.start_time_label.configure(text=start_time)
-            self.end_time_label.configure(text=end_time)
-            
-            # Update duration label if it exists
-            if hasattr(self, 'duration_label'):
-                duration = cut_data.get("duration", "00:00:00")
-                self.duration_label.configure(text=duration)
-            
-            # Update title and description fields
-            self.title_entry.delete(0, 'end')
-            self.title_entry.insert(0, cut_data.get("title", ""))
-            
-            self.desc_entry.delete(0, 'end')
-            self.desc_entry.insert(0, cut_data.get("description", ""))
-            
             # Load the cut preview (video frame)
             self.load_cut_preview(cut_data)
         else:
-            self.selected_cut = None
-            # Clear all fields
-            self.start_time_label.configure(text="00:00:00")
-            self.end_time_label.configure(text="00:00:00")
-            if hasattr(self, 'duration_label'):
-                self.duration_label.configure(text="00:00:00")
-            self.title_entry.delete(0, 'end')
-            self.desc_entry.delete(0, 'end')
             self.show_placeholder()
+    
+    def _fill_cut_info(self, cut_data):
+        """Write the cut's times, title and description into the info panel (if built)"""
+        if self.info_content_frame is None:
+            return  # Filled from selected_cut when the panel is first expanded
+        
+        if cut_data:
+            start_time = cut_data.get("start_time", cut_data.get("start", "00:00:00"))
+            end_time = cut_data.get("end_time", cut_data.get("end", "00:00:00"))
+            duration = cut_data.get("duration", "00:00:00")
+            title = cut_data.get("title", "")
+            description = cut_data.get("description", "")
+        else:
+            # Clear all fields
+            start_time = end_time = duration = "00:00:00"
+            title = description = ""
+        
+        # Only touch widgets whose value actually changes (each write redraws the widget)
+        self._set_label_text(self.start_time_label, start_time)
+        self._set_label_text(self.end_time_label, end_time)
+        if hasattr(self, 'duration_label'):
+            self._set_label_text(self.duration_label, duration)
+        self._set_entry_text(self.title_entry, title)
+        self._set_entry_text(self.desc_entry, description)
+    
+    @staticmethod
+    def _set_label_text(label, text):
+        """Configure a label's text if it differs from what is shown"""
+        if label.cget("text") != text:
+            label.configure(text=text)
+    
+    @staticmethod
+    def _set_entry_text(entry, text):
+        """Replace an entry's content if it differs from what is shown"""
+        if entry.get() != text:
+            entry.delete(0, 'end')
+            entry.insert(0, text)
+    
+    def destroy(self):
+        """Cancel a pending cut info redraw before destroying the component"""
+        if self._cut_info_job is not None:
+            self.after_cancel(self._cut_info_job)
+            self._cut_info_job = None
+        super().destroy()
@@ -4,9 +4,11 @@ Live Video Editor - Main Application Window
 """
 
 import customtkinter as ctk
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from .styles.theme import apply_theme, COLORS, FONTS, SPACING, get_frame_style, get_text_style
 from .components import VideoLoaderComponent, CutTimesInputComponent, ManualInputComponent, MainEditorComponent
-from .components.video_loader import VideoLoaderComponent
 
 class MainWindow(ctk.CTk):
     def __init__(self):
@@ -33,6 +35,9 @@ class MainWindow(ctk.CTk):
         self.loaded_cuts_data = None
         self.has_cached_transcription = False
         
+        # Shared worker pool for short background jobs of the components
+        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="lve-worker")
+        
         # Initialize UI
         self.setup_ui()
     
@@ -108,7 +113,8 @@ class MainWindow(ctk.CTk):
         """Show video loading phase"""
         video_loader = VideoLoaderComponent(
             self.content_frame,
-            on_video_loaded=self.on_video_loaded
+            on_video_loaded=self.on_video_loaded,
+            executor=self.executor
         )
         video_loader.grid(row=0, column=0, sticky="nsew", padx=SPACING["lg"], pady=SPACING["lg"])
     
@@ -128,7 +134,8 @@ class MainWindow(ctk.CTk):
         """Show manual input phase"""
         manual_input = ManualInputComponent(
             self.content_frame,
-            on_process_complete=self.on_manual_input_complete
+            on_process_complete=self.on_manual_input_complete,
+            executor=self.executor
         )
         manual_input.grid(row=0, column=0, sticky="nsew", padx=SPACING["lg"], pady=SPACING["lg"])
     
@@ -281,6 +288,16 @@ class MainWindow(ctk.CTk):
         
         # Show video loading phase
         self.show_current_phase()
+    
+    def destroy(self):
+        """Stop the shared worker pool and destroy the window"""
+        # Drop queued jobs first, so no thumbnail/parse/probe result is handed to
+        # widgets that are gone (cancel_futures needs Python 3.9+)
+        if sys.version_info >= (3, 9):
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self.executor.shutdown(wait=False)
+        super().destroy()
 
 if __name__ == "__main__":
     app = MainWindow()
@@ -4,6 +4,8 @@ Live Video Editor UI Theme System
 """
 
 import customtkinter as ctk
+from functools import lru_cache
+from types import MappingProxyType
 
 # Color Palette
 COLORS = {
@@ -58,8 +60,14 @@ def apply_theme():
     ctk.set_widget_scaling(1.0)
     ctk.set_window_scaling(1.0)
 
+@lru_cache(maxsize=None)
+def get_font(family, size, weight="normal"):
+    """Get a shared CTkFont (created on first use, since it needs the Tk root)"""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+@lru_cache(maxsize=None)
 def get_button_style(variant="primary"):
-    """Get button styling configuration"""
+    """Get button styling configuration (memoized, read-only: copy with dict() to modify)"""
     styles = {
         "primary": {
             "fg_color": COLORS["accent"],
@@ -97,10 +105,11 @@ def get_button_style(variant="primary"):
             "font": FONTS["main"],
         }
     }
-    return styles.get(variant, styles["primary"])
+    return MappingProxyType(styles.get(variant, styles["primary"]))
 
+@lru_cache(maxsize=None)
 def get_frame_style(variant="default"):
-    """Get frame styling configuration"""
+    """Get frame styling configuration (memoized, read-only: copy with dict() to modify)"""
     styles = {
         "default": {
             "fg_color": COLORS["secondary"],
@@ -117,10 +126,11 @@ def get_frame_style(variant="default"):
             "border_color": COLORS["border"],
         }
     }
-    return styles.get(variant, styles["default"])
+    return MappingProxyType(styles.get(variant, styles["default"]))
 
+@lru_cache(maxsize=None)
 def get_text_style(variant="default"):
-    """Get text styling configuration"""
+    """Get text styling configuration (memoized, read-only: copy with dict() to modify)"""
     styles = {
         "default": {
             "text_color": COLORS["text"],
@@ -143,4 +153,4 @@ def get_text_style(variant="default"):
             "font": FONTS["small"],
         }
     }
-    return styles.get(variant, styles["default"])
+    return MappingProxyType(styles.get(variant, styles["default"]))
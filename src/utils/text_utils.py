@@ -7,6 +7,10 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Compiled once at import; the parser runs them for every line
+_TIME_LINE_RE = re.compile(r'^\d{2}:\d{2}:\d{2}\s*-\s*\d{2}:\d{2}:\d{2}')
+_TIME_FORMAT_RE = re.compile(r'^\d{2}:\d{2}:\d{2}$')
+
 
 def parse_cuts_content(text_content: str, source_name: str = "Manual Input") -> Tuple[bool, str, Optional[Dict]]:
     """
@@ -23,37 +27,30 @@ def parse_cuts_content(text_content: str, source_name: str = "Manual Input") ->
         return False, "Content is empty", None
     
     try:
-        lines = text_content.strip().split('\n')
+        lines = text_content.strip().splitlines()
         
-        # Validate all lines first
+        # Validate and parse in a single pass (stops at the first invalid line)
         valid_lines = 0
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line:  # Skip empty lines
-                continue
-                
-            if _is_valid_time_line(line):
-                valid_lines += 1
-            else:
-                return False, f"Invalid format on line {line_num}: '{line}'", None
-        
-        if valid_lines == 0:
-            return False, "No valid time ranges found", None
-        
-        # Parse all lines
         cuts = []
         cut_index = 1
         
-        for line in lines:
+        for line_num, line in enumerate(lines, 1):
             line = line.strip()
             if not line:  # Skip empty lines
                 continue
             
+            if not _is_valid_time_line(line):
+                return False, f"Invalid format on line {line_num}: '{line}'", None
+            valid_lines += 1
+            
             cut_data = _parse_cut_line(line, cut_index)
             if cut_data:
                 cuts.append(cut_data)
                 cut_index += 1
         
+        if valid_lines == 0:
+            return False, "No valid time ranges found", None
+        
         cuts_data = {
             "cuts": cuts,
             "total_cuts": len(cuts),
@@ -102,8 +99,8 @@ def validate_and_parse_cuts_file(file_path: str) -> Tuple[bool, str, Optional[Di
 
 def _is_valid_time_line(line: str) -> bool:
     """Check if a line has valid time format"""
-    time_pattern = r'^\d{2}:\d{2}:\d{2}\s*-\s*\d{2}:\d{2}:\d{2}'
-    return bool(re.match(time_pattern, line))
+    # Substring pre-check rejects obviously wrong lines without running the regex
+    return ':' in line and _TIME_LINE_RE.match(line) is not None
 
 
 def _parse_cut_line(line: str, cut_index: int) -> Optional[Dict]:
@@ -145,8 +142,7 @@ def _parse_cut_line(line: str, cut_index: int) -> Optional[Dict]:
 
 def _is_valid_time_format(time_str: str) -> bool:
     """Validate HH:MM:SS format"""
-    pattern = r'^\d{2}:\d{2}:\d{2}$'
-    if not re.match(pattern, time_str):
+    if not _TIME_FORMAT_RE.match(time_str):
         return False
     
     try:
@@ -4,11 +4,33 @@ Manages video frame extraction and caching for cuts display
 """
 
 import cv2
+import hashlib
+import os
+import shutil
 import threading
+import tkinter as tk
+from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 from PIL import Image
 import time
 
+# Resampling used for the small list thumbnails. Frames are downscaled by a large
+# factor, so Pillow first reduces them by an integer factor (reducing_gap) and
+# only then applies this filter, like Image.thumbnail() does
+THUMBNAIL_FILTER = Image.Resampling.BILINEAR
+THUMBNAIL_REDUCING_GAP = 2.0
+
+# Resized list thumbnails are kept on disk as PPM files, which Tk loads natively,
+# so warm runs build their PhotoImages without going through PIL
+THUMBNAIL_DISK_CACHE_DIR = Path.home() / ".live_video_editor" / "thumbnail_cache"
+
+# Each video gets its own directory, keyed like the audio cache (path + size + mtime),
+# so an edited video leaves its old directory behind. Other videos' directories
+# unused for this long, or the oldest ones while over the size limit, are removed
+# in the background when a cache is created
+THUMBNAIL_DISK_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+THUMBNAIL_DISK_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
 
 class ThumbnailCache:
     """
@@ -19,11 +41,18 @@ class ThumbnailCache:
     def __init__(self, video_path: str):
         self.video_path = video_path
         self.cache: Dict[float, Image.Image] = {}  # time_seconds -> PIL.Image
+        # (time_seconds, size) -> resized PhotoImage; only touched from the Tk main thread
+        self.photo_cache: Dict[Tuple[float, Tuple[int, int]], tk.PhotoImage] = {}
+        self.disk_cache_dir = THUMBNAIL_DISK_CACHE_DIR / self._get_video_key()
         self.is_loading = False
         self.load_progress = 0.0
         self.total_thumbnails = 0
         self._lock = threading.Lock()
         
+        # Walking and deleting old directories grows with the cache size, so it
+        # runs in the background instead of delaying the editor
+        threading.Thread(target=self._prune_disk_cache, name="thumbnail-cache-prune", daemon=True).start()
+        
     def preload_cut_thumbnails(self, cuts_data: List[dict]) -> bool:
         """
         Pre-generate all frames for the given cuts (original size)
@@ -111,6 +140,135 @@ class ThumbnailCache:
             print(f"❌ Error getting thumbnail for {start_time}: {e}")
             return None
     
+    def prepare_thumbnail_file(self, start_time: str, size: Tuple[int, int] = (80, 60)) -> Optional[Path]:
+        """
+        Make sure the resized thumbnail for a start time exists on disk
+        Safe to call from worker threads (no Tk objects are created).
+        
+        Args:
+            start_time: Time string in HH:MM:SS format
+            size: Target (width, height) in pixels
+            
+        Returns:
+            Path of the PPM thumbnail or None if the frame is not available
+        """
+        time_seconds = self._parse_time_to_seconds(start_time)
+        path = self._get_disk_path(time_seconds, size)
+        if path.exists():
+            return path
+        
+        with self._lock:
+            frame_image = self.cache.get(time_seconds)
+        if frame_image is None:
+            return None
+        
+        try:
+            resized = frame_image.resize(size, THUMBNAIL_FILTER, reducing_gap=THUMBNAIL_REDUCING_GAP)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write under a unique name first so readers never see a partial file
+            temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            resized.save(temp_path, "PPM")
+            os.replace(temp_path, path)
+            return path
+        except Exception as e:
+            print(f"❌ Error writing thumbnail for {start_time}: {e}")
+            return None
+    
+    def peek_photoimage(self, start_time: str, size: Tuple[int, int] = (80, 60)) -> Optional[tk.PhotoImage]:
+        """
+        Get an already loaded PhotoImage without doing any image work
+        Must be called from the Tk main thread.
+        
+        Args:
+            start_time: Time string in HH:MM:SS format
+            size: Target (width, height) in pixels
+            
+        Returns:
+            Cached PhotoImage or None if it has not been loaded yet
+        """
+        return self.photo_cache.get((self._parse_time_to_seconds(start_time), size))
+    
+    def get_photoimage(self, start_time: str, size: Tuple[int, int] = (80, 60)) -> Optional[tk.PhotoImage]:
+        """
+        Get a resized PhotoImage for a specific start time, loading it only once
+        The cache owns the PhotoImage references, so they survive list rebuilds.
+        Must be called from the Tk main thread; call prepare_thumbnail_file() from
+        a worker first to keep the resize itself off the main thread.
+        
+        Args:
+            start_time: Time string in HH:MM:SS format
+            size: Target (width, height) in pixels
+            
+        Returns:
+            PhotoImage of the frame at the given size or None if not available
+        """
+        key = (self._parse_time_to_seconds(start_time), size)
+        photo_image = self.photo_cache.get(key)
+        if photo_image is not None:
+            return photo_image
+        
+        path = self.prepare_thumbnail_file(start_time, size)
+        if path is None:
+            return None
+        
+        try:
+            photo_image = tk.PhotoImage(file=str(path))
+        except tk.TclError as e:
+            print(f"❌ Error loading thumbnail image for {start_time}: {e}")
+            return None
+        
+        self.photo_cache[key] = photo_image
+        return photo_image
+    
+    def _drop_photoimages(self, time_seconds: float):
+        """Forget the resized images of a frame that changed or was removed"""
+        for key in [key for key in self.photo_cache if key[0] == time_seconds]:
+            del self.photo_cache[key]
+        for path in self.disk_cache_dir.glob(f"{time_seconds:.3f}_*.ppm"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+    
+    def _get_video_key(self) -> str:
+        """Unique key for the video file (path + size + mtime), as used by the audio cache"""
+        try:
+            stat = os.stat(self.video_path)
+            key_string = f"{self.video_path}_{stat.st_size}_{stat.st_mtime}"
+        except OSError:
+            key_string = self.video_path
+        return hashlib.md5(key_string.encode()).hexdigest()
+    
+    def _get_disk_path(self, time_seconds: float, size: Tuple[int, int]) -> Path:
+        """PPM file path of a resized thumbnail"""
+        return self.disk_cache_dir / f"{time_seconds:.3f}_{size[0]}x{size[1]}.ppm"
+    
+    def _prune_disk_cache(self):
+        """Remove stale thumbnail directories of other videos (or other versions of this one); runs on its own thread"""
+        try:
+            # Mark this video's directory as used, so its age counts from now
+            if self.disk_cache_dir.exists():
+                os.utime(self.disk_cache_dir)
+            
+            other_dirs = []
+            for path in THUMBNAIL_DISK_CACHE_DIR.iterdir():
+                if path.is_dir() and path != self.disk_cache_dir:
+                    size = sum(entry.stat().st_size for entry in path.iterdir() if entry.is_file())
+                    other_dirs.append((path.stat().st_mtime, size, path))
+            own_size = sum(entry.stat().st_size for entry in self.disk_cache_dir.glob("*") if entry.is_file())
+        except OSError:
+            return  # No cache directory yet (or unreadable): nothing to prune
+        
+        # Oldest first: drop expired directories, then more until under the size limit
+        oldest_allowed = time.time() - THUMBNAIL_DISK_CACHE_MAX_AGE
+        total_size = own_size + sum(size for _, size, _ in other_dirs)
+        for mtime, size, path in sorted(other_dirs):
+            if mtime >= oldest_allowed and total_size <= THUMBNAIL_DISK_CACHE_MAX_BYTES:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
+            print(f"🗑️ Removed stale thumbnail cache: {path.name}")
+    
     def get_cache_stats(self) -> dict:
         """Get cache statistics"""
         return {
@@ -121,9 +279,11 @@ class ThumbnailCache:
         }
     
     def clear_cache(self):
-        """Clear all cached thumbnails"""
+        """Clear all cached thumbnails, including this video's resized files on disk"""
         with self._lock:
             self.cache.clear()
+        self.photo_cache.clear()
+        shutil.rmtree(self.disk_cache_dir, ignore_errors=True)
         print("🗑️ Thumbnail cache cleared")
     
     def _extract_frame_at_time(self, cap: cv2.VideoCapture, time_seconds: float, fps: float) -> Optional[Image.Image]:
@@ -218,6 +378,7 @@ class ThumbnailCache:
             if frame_image:
                 with self._lock:
                     self.cache[time_seconds] = frame_image
+                self._drop_photoimages(time_seconds)
                 print(f"🔄 Regenerated frame for {start_time}")
                 return True
             else:
@@ -241,6 +402,7 @@ class ThumbnailCache:
                 if time_seconds in self.cache:
                     del self.cache[time_seconds]
                     print(f"🗑️ Removed old frame for {start_time}")
+            self._drop_photoimages(time_seconds)
         except Exception as e:
             print(f"❌ Error removing frame for {start_time}: {e}")
 